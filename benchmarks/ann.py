@@ -0,0 +1,128 @@
+import argparse
+import json
+import numpy as np
+from pgvector import Bit, HalfVector, SparseVector
+from pgvector.psycopg import register_vector, tune_search
+import psycopg
+from time import perf_counter
+
+# operator class for each type (ivfflat does not support sparsevec)
+OPCLASSES = {
+    'vector': ('vector_l2_ops', 'l2_distance'),
+    'halfvec': ('halfvec_l2_ops', 'l2_distance'),
+    'bit': ('bit_hamming_ops', 'hamming_distance'),
+    'sparsevec': ('sparsevec_l2_ops', 'l2_distance')
+}
+
+
+def int_list(value):
+    return [int(v) for v in value.split(',')]
+
+
+parser = argparse.ArgumentParser(description='Measure build time, index size, QPS, and recall of pgvector indexes')
+parser.add_argument('--fvecs', help='load vectors from an .fvecs file instead of generating them')
+parser.add_argument('--rows', type=int, default=100000)
+parser.add_argument('--dimensions', type=int, default=128)
+parser.add_argument('--queries', type=int, default=100)
+parser.add_argument('--k', type=int, default=10)
+parser.add_argument('--types', default='vector,halfvec,bit,sparsevec')
+parser.add_argument('--indexes', default='hnsw,ivfflat')
+parser.add_argument('--m', type=int, default=16)
+parser.add_argument('--ef-construction', type=int, default=64)
+parser.add_argument('--ef-search', type=int_list, default=[10, 20, 40, 80, 160])
+parser.add_argument('--lists', type=int, default=100)
+parser.add_argument('--probes', type=int_list, default=[1, 2, 4, 8, 16])
+parser.add_argument('--density', type=float, default=0.1, help='fraction of nonzero elements for sparsevec')
+parser.add_argument('--maintenance-work-mem', default='1GB')
+args = parser.parse_args()
+
+
+def read_fvecs(path):
+    data = np.fromfile(path, dtype='<i4')
+    dim = data[0]
+    return data.reshape(-1, dim + 1)[:, 1:].view('<f4')
+
+
+def convert(embeddings, type):
+    if type == 'halfvec':
+        return [HalfVector(e) for e in embeddings]
+    elif type == 'bit':
+        # binary quantize around the median of each dimension
+        return [Bit(e) for e in embeddings > median]
+    elif type == 'sparsevec':
+        # keep the largest elements of each row
+        return [SparseVector(np.where(e >= np.quantile(e, 1 - args.density), e, 0)) for e in embeddings]
+    return list(embeddings)
+
+
+if args.fvecs:
+    embeddings = read_fvecs(args.fvecs)
+else:
+    embeddings = np.random.rand(args.rows + args.queries, args.dimensions).astype(np.float32)
+
+# hold out queries so they are not in the table
+embeddings, queries = embeddings[:-args.queries], embeddings[-args.queries:]
+rows, dimensions = embeddings.shape
+median = np.median(embeddings, axis=0)
+
+conn = psycopg.connect(dbname='pgvector_benchmark', autocommit=True)
+conn.execute('CREATE EXTENSION IF NOT EXISTS vector')
+register_vector(conn)
+conn.execute('SELECT set_config(%s, %s, false)', ('maintenance_work_mem', args.maintenance_work_mem))
+
+for type in args.types.split(','):
+    opclass, distance = OPCLASSES[type]
+
+    conn.execute('DROP TABLE IF EXISTS ann_items')
+    conn.execute(f'CREATE TABLE ann_items (id bigint PRIMARY KEY, embedding {type}({dimensions}))')
+
+    start = perf_counter()
+    cur = conn.cursor()
+    with cur.copy('COPY ann_items (id, embedding) FROM STDIN WITH (FORMAT BINARY)') as copy:
+        copy.set_types(['int8', type])
+        for i, embedding in enumerate(convert(embeddings, type)):
+            copy.write_row([i, embedding])
+    load_time = perf_counter() - start
+    conn.execute('ANALYZE ann_items')
+
+    type_queries = convert(queries, type)
+
+    for index in args.indexes.split(','):
+        if index == 'hnsw':
+            options = {'m': args.m, 'ef_construction': args.ef_construction}
+            settings = [{'hnsw.ef_search': v} for v in args.ef_search]
+        else:
+            if type == 'sparsevec':
+                continue
+            options = {'lists': args.lists}
+            settings = [{'ivfflat.probes': v} for v in args.probes]
+
+        conn.execute('DROP INDEX IF EXISTS ann_index')
+        with_options = ', '.join(f'{k} = {v}' for k, v in options.items())
+        start = perf_counter()
+        conn.execute(f'CREATE INDEX ann_index ON ann_items USING {index} (embedding {opclass}) WITH ({with_options})')
+        build_time = perf_counter() - start
+        index_size = conn.execute("SELECT pg_relation_size('ann_index')").fetchone()[0]
+
+        results = tune_search(conn, 'ann_items', 'embedding', type_queries, k=args.k, distance=distance, type=type, settings=settings)
+        for result in results[1:]:
+            record = {
+                'type': type,
+                'index': index,
+                'options': options,
+                'settings': result['settings'],
+                'rows': rows,
+                'dimensions': dimensions,
+                'k': args.k,
+                'load_time': load_time,
+                'build_time': build_time,
+                'index_size': index_size,
+                'recall': result['recall'],
+                'qps': 1 / result['latency'],
+                'latency': result['latency'],
+                'p99_latency': result['p99_latency'],
+                'exact_latency': results[0]['latency']
+            }
+            print(json.dumps(record), flush=True)
+
+conn.execute('DROP TABLE IF EXISTS ann_items')
@@ -0,0 +1,43 @@
+import asyncio
+import asyncpg
+from pgvector import Vector, HalfVector, SparseVector
+from pgvector.asyncpg import init_vector, register_vector
+from time import perf_counter
+
+connections = 100
+
+
+# previous behavior: one set_type_codec call (and introspection query) per type
+async def set_type_codecs(conn):
+    for typename, cls in [('vector', Vector), ('halfvec', HalfVector), ('sparsevec', SparseVector)]:
+        await conn.set_type_codec(typename, encoder=cls._to_db_binary, decoder=cls._from_db_binary, format='binary')
+
+
+async def warmup(init):
+    start = perf_counter()
+    pool = await asyncpg.create_pool(database='pgvector_benchmark', min_size=connections, max_size=connections, init=init)
+    elapsed = perf_counter() - start
+    await pool.close()
+    return elapsed
+
+
+async def main():
+    conn = await asyncpg.connect(database='pgvector_benchmark')
+    await conn.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    await conn.close()
+
+    inits = {
+        'none': None,
+        'set_type_codec': set_type_codecs,
+        'register_vector': register_vector,
+        'init_vector': init_vector()
+    }
+
+    print(f'Pool warmup for {connections} connections')
+    for name, init in inits.items():
+        # take the best of a few runs to reduce noise
+        elapsed = min([await warmup(init) for _ in range(3)])
+        print(f'{name:>16}: {elapsed * 1000:.1f} ms')
+
+
+asyncio.run(main())
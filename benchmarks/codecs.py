@@ -0,0 +1,134 @@
+import argparse
+from functools import partial
+import json
+import numpy as np
+from pgvector import Bit, HalfVector, SparseVector, Vector
+from pgvector.asyncpg.register import _halfvec_from_db_binary_numpy
+import pgvector.psycopg.bit
+import pgvector.psycopg.halfvec
+import pgvector.psycopg.sparsevec
+import pgvector.psycopg.vector
+import pgvector.psycopg2.halfvec
+import pgvector.psycopg2.sparsevec
+import pgvector.psycopg2.vector
+from timeit import Timer
+
+
+def int_list(value):
+    return [int(v) for v in value.split(',')]
+
+
+def float_list(value):
+    return [float(v) for v in value.split(',')]
+
+
+parser = argparse.ArgumentParser(description='Measure encoding and decoding of each type')
+parser.add_argument('--dimensions', type=int_list, default=[128, 512, 1536, 4096])
+parser.add_argument('--density', type=float_list, default=[0.01, 0.1, 0.5], help='fractions of nonzero elements for sparsevec')
+parser.add_argument('--filter', help='only run cases containing this string')
+parser.add_argument('--json', action='store_true', help='print one JSON object per case')
+args = parser.parse_args()
+
+
+# asyncpg and pg8000 register the _to_db_binary, _from_db_binary,
+# _to_db, and _from_db class methods directly, so those cases cover them
+def cases(dim):
+    rng = np.random.default_rng(1)
+    embedding = rng.random(dim, dtype=np.float32)
+
+    vec = Vector(embedding)
+    text, binary = vec.to_text(), vec.to_binary()
+    yield 'Vector', {
+        'to_text': lambda: vec.to_text(),
+        'from_text': lambda: Vector.from_text(text),
+        'to_binary': lambda: vec.to_binary(),
+        'from_binary': lambda: Vector.from_binary(binary),
+        '_to_db': lambda: Vector._to_db(embedding),
+        '_from_db': lambda: Vector._from_db(text),
+        '_to_db_binary': lambda: Vector._to_db_binary(embedding),
+        '_from_db_binary': lambda: Vector._from_db_binary(binary),
+        'psycopg dump': partial(pgvector.psycopg.vector.VectorDumper(np.ndarray).dump, embedding),
+        'psycopg dump binary': partial(pgvector.psycopg.vector.VectorBinaryDumper(np.ndarray).dump, embedding),
+        'psycopg load': partial(pgvector.psycopg.vector.VectorLoader(0).load, memoryview(text.encode())),
+        'psycopg load binary': partial(pgvector.psycopg.vector.VectorBinaryLoader(0).load, memoryview(binary)),
+        'psycopg2 adapt': lambda: pgvector.psycopg2.vector.VectorAdapter(embedding).getquoted(),
+        'psycopg2 cast': lambda: pgvector.psycopg2.vector.cast_vector(text, None)
+    }
+
+    half = HalfVector(embedding)
+    text, binary = half.to_text(), half.to_binary()
+    yield 'HalfVector', {
+        'to_text': lambda: half.to_text(),
+        'from_text': lambda: HalfVector.from_text(text),
+        'to_binary': lambda: half.to_binary(),
+        'from_binary': lambda: HalfVector.from_binary(binary),
+        '_to_db': lambda: HalfVector._to_db(half),
+        '_from_db': lambda: HalfVector._from_db(text),
+        '_to_db_binary': lambda: HalfVector._to_db_binary(half),
+        '_from_db_binary': lambda: HalfVector._from_db_binary(binary),
+        'psycopg dump': partial(pgvector.psycopg.halfvec.HalfVectorDumper(HalfVector).dump, half),
+        'psycopg dump binary': partial(pgvector.psycopg.halfvec.HalfVectorBinaryDumper(HalfVector).dump, half),
+        'psycopg load': partial(pgvector.psycopg.halfvec.HalfVectorLoader(0).load, memoryview(text.encode())),
+        'psycopg load binary': partial(pgvector.psycopg.halfvec.HalfVectorBinaryLoader(0).load, memoryview(binary)),
+        'psycopg2 adapt': lambda: pgvector.psycopg2.halfvec.HalfvecAdapter(half).getquoted(),
+        'psycopg2 cast': lambda: pgvector.psycopg2.halfvec.cast_halfvec(text, None),
+        'asyncpg decode numpy': lambda: _halfvec_from_db_binary_numpy(binary)
+    }
+
+    bit = Bit(embedding > 0.5)
+    text, binary = bit.to_text(), bit.to_binary()
+    yield 'Bit', {
+        'to_text': lambda: bit.to_text(),
+        'from_text': lambda: Bit.from_text(text),
+        'to_binary': lambda: bit.to_binary(),
+        'from_binary': lambda: Bit.from_binary(binary),
+        '_to_db': lambda: Bit._to_db(bit),
+        '_to_db_binary': lambda: Bit._to_db_binary(bit),
+        'psycopg dump': partial(pgvector.psycopg.bit.BitDumper(Bit).dump, bit),
+        'psycopg dump binary': partial(pgvector.psycopg.bit.BitBinaryDumper(Bit).dump, bit)
+    }
+
+    for density in args.density:
+        dense = np.where(rng.random(dim) < density, embedding, 0)
+        sparse = SparseVector(dense)
+        text, binary = sparse.to_text(), sparse.to_binary()
+        yield f'SparseVector density={density}', {
+            'from_dense': lambda: SparseVector(dense),
+            'to_text': lambda: sparse.to_text(),
+            'from_text': lambda: SparseVector.from_text(text),
+            'to_binary': lambda: sparse.to_binary(),
+            'from_binary': lambda: SparseVector.from_binary(binary),
+            '_to_db': lambda: SparseVector._to_db(sparse),
+            '_from_db': lambda: SparseVector._from_db(text),
+            '_to_db_binary': lambda: SparseVector._to_db_binary(sparse),
+            '_from_db_binary': lambda: SparseVector._from_db_binary(binary),
+            'psycopg dump': partial(pgvector.psycopg.sparsevec.SparseVectorDumper(SparseVector).dump, sparse),
+            'psycopg dump binary': partial(pgvector.psycopg.sparsevec.SparseVectorBinaryDumper(SparseVector).dump, sparse),
+            'psycopg load': partial(pgvector.psycopg.sparsevec.SparseVectorLoader(0).load, memoryview(text.encode())),
+            'psycopg load binary': partial(pgvector.psycopg.sparsevec.SparseVectorBinaryLoader(0).load, memoryview(binary)),
+            'psycopg2 adapt': lambda: pgvector.psycopg2.sparsevec.SparsevecAdapter(sparse).getquoted(),
+            'psycopg2 cast': lambda: pgvector.psycopg2.sparsevec.cast_sparsevec(text, None)
+        }
+
+
+def measure(fn):
+    # run batches of at least 10 ms and keep the best of 5
+    timer = Timer(fn)
+    number = 1
+    while timer.timeit(number) < 0.01:
+        number *= 10
+    return min(timer.repeat(5, number)) / number
+
+
+for dim in args.dimensions:
+    for type, functions in cases(dim):
+        for name, fn in functions.items():
+            case = f'{type} {name}'
+            if args.filter and args.filter not in case:
+                continue
+
+            seconds = measure(fn)
+            if args.json:
+                print(json.dumps({'type': type, 'function': name, 'dimensions': dim, 'seconds': seconds}), flush=True)
+            else:
+                print(f'{dim:>5} {case:<50} {seconds * 1e6:>10.2f} us', flush=True)
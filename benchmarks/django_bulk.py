@@ -0,0 +1,63 @@
+import django
+from django.conf import settings
+from django.db import connection, models
+import numpy as np
+from pgvector.django import VectorExtension, VectorField, VectorManager
+from time import perf_counter
+
+rows = 100000
+dimensions = 768
+runs = 3
+
+settings.configure(
+    DATABASES={
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': 'pgvector_benchmark',
+        }
+    }
+)
+django.setup()
+
+
+class Item(models.Model):
+    embedding = VectorField(dimensions=dimensions)
+
+    objects = VectorManager()
+
+    class Meta:
+        app_label = 'benchmark'
+        db_table = 'django_bulk_items'
+
+
+with connection.cursor() as cursor:
+    cursor.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    cursor.execute('DROP TABLE IF EXISTS django_bulk_items')
+with connection.schema_editor() as schema_editor:
+    schema_editor.create_model(Item)
+
+embeddings = np.random.rand(rows, dimensions).astype(np.float32)
+
+
+def bulk_create():
+    Item.objects.bulk_create([Item(embedding=embedding) for embedding in embeddings], batch_size=1000)
+
+
+def bulk_copy():
+    Item.objects.bulk_copy([Item(embedding=embedding) for embedding in embeddings])
+
+
+def bulk_copy_arrays():
+    Item.objects.bulk_copy({'embedding': embeddings})
+
+
+print(f'{rows} rows with {dimensions} dimensions ({runs} runs)')
+for name, fn in [('bulk_create', bulk_create), ('bulk_copy', bulk_copy), ('bulk_copy (arrays)', bulk_copy_arrays)]:
+    times = []
+    for _ in range(runs):
+        with connection.cursor() as cursor:
+            cursor.execute('TRUNCATE django_bulk_items')
+        start = perf_counter()
+        fn()
+        times.append(perf_counter() - start)
+    print(f'{name:>18}: {rows / np.median(times):.0f} rows/s (median)')
@@ -0,0 +1,48 @@
+import numpy as np
+from pgvector.psycopg import pipeline_neighbors, register_vector
+import psycopg
+from time import perf_counter
+
+rows = 10000
+dimensions = 128
+searches = 50
+runs = 10
+
+conn = psycopg.connect(dbname='pgvector_benchmark', autocommit=True)
+conn.execute('CREATE EXTENSION IF NOT EXISTS vector')
+register_vector(conn)
+
+conn.execute('DROP TABLE IF EXISTS pipeline_items')
+conn.execute(f'CREATE TABLE pipeline_items (id bigserial PRIMARY KEY, tenant_id int, embedding vector({dimensions}))')
+
+cur = conn.cursor()
+with cur.copy('COPY pipeline_items (tenant_id, embedding) FROM STDIN WITH (FORMAT BINARY)') as copy:
+    copy.set_types(['int4', 'vector'])
+    for i, embedding in enumerate(np.random.rand(rows, dimensions)):
+        copy.write_row([i % searches, embedding])
+
+conn.execute('CREATE INDEX ON pipeline_items (tenant_id)')
+conn.execute('ANALYZE pipeline_items')
+
+# one search per tenant
+queries = np.random.rand(searches, dimensions)
+params = [{'table': 'pipeline_items', 'column': 'embedding', 'query': query, 'where': 'tenant_id = %s', 'params': (i,)} for i, query in enumerate(queries)]
+
+
+def sequential():
+    for p in params:
+        conn.execute('SELECT id, embedding <-> %s FROM pipeline_items WHERE tenant_id = %s ORDER BY 2 LIMIT 10', (p['query'], *p['params']), binary=True).fetchall()
+
+
+def pipelined():
+    pipeline_neighbors(conn, params)
+
+
+print(f'{searches} searches ({runs} runs)')
+for name, fn in [('sequential', sequential), ('pipeline', pipelined)]:
+    times = []
+    for _ in range(runs):
+        start = perf_counter()
+        fn()
+        times.append(perf_counter() - start)
+    print(f'{name:>10}: {np.median(times) * 1000:.1f} ms (median)')
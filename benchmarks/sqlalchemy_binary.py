@@ -0,0 +1,55 @@
+import numpy as np
+from pgvector.sqlalchemy import VECTOR, register_vector
+from sqlalchemy import BigInteger, create_engine, delete, select, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from time import perf_counter
+
+rows = 2000
+dimensions = 768
+runs = 5
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = 'sqlalchemy_binary_items'
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    embedding = mapped_column(VECTOR(dimensions))
+
+
+text_engine = create_engine('postgresql+psycopg://localhost/pgvector_benchmark')
+binary_engine = create_engine('postgresql+psycopg://localhost/pgvector_benchmark')
+register_vector(binary_engine)
+
+with text_engine.begin() as connection:
+    connection.execute(text('CREATE EXTENSION IF NOT EXISTS vector'))
+Base.metadata.drop_all(text_engine)
+Base.metadata.create_all(text_engine)
+
+embeddings = np.random.rand(rows, dimensions).astype(np.float32)
+
+
+def insert(engine):
+    with Session(engine) as session:
+        session.execute(delete(Item))
+        session.add_all([Item(embedding=embedding) for embedding in embeddings])
+        session.commit()
+
+
+def load(engine):
+    with Session(engine) as session:
+        session.scalars(select(Item.embedding)).all()
+
+
+print(f'{rows} rows with {dimensions} dimensions ({runs} runs)')
+for name, fn in [('insert', insert), ('select', load)]:
+    for format, engine in [('text', text_engine), ('binary', binary_engine)]:
+        times = []
+        for _ in range(runs):
+            start = perf_counter()
+            fn(engine)
+            times.append(perf_counter() - start)
+        print(f'{name:>6} {format:>6}: {rows / np.median(times):.0f} rows/s (median)')
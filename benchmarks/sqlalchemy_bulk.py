@@ -0,0 +1,52 @@
+import numpy as np
+from pgvector.sqlalchemy import VECTOR, bulk_insert, register_vector
+from sqlalchemy import BigInteger, create_engine, insert, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from time import perf_counter
+
+rows = 20000
+dimensions = 768
+runs = 3
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = 'sqlalchemy_bulk_items'
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    embedding = mapped_column(VECTOR(dimensions))
+
+
+engine = create_engine('postgresql+psycopg://localhost/pgvector_benchmark')
+register_vector(engine)
+
+with engine.begin() as connection:
+    connection.execute(text('CREATE EXTENSION IF NOT EXISTS vector'))
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+
+params = [{'id': i, 'embedding': embedding} for i, embedding in enumerate(np.random.rand(rows, dimensions).astype(np.float32))]
+
+
+def executemany(session):
+    session.execute(insert(Item), params)
+
+
+def copy(session):
+    bulk_insert(session, Item, params)
+
+
+print(f'{rows} rows with {dimensions} dimensions ({runs} runs)')
+for name, fn in [('insert', executemany), ('bulk_insert', copy)]:
+    times = []
+    for _ in range(runs):
+        with Session(engine) as session:
+            session.execute(text('TRUNCATE sqlalchemy_bulk_items'))
+            start = perf_counter()
+            fn(session)
+            session.commit()
+            times.append(perf_counter() - start)
+    print(f'{name:>11}: {rows / np.median(times):.0f} rows/s (median)')
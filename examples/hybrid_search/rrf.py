@@ -1,4 +1,4 @@
-from pgvector.psycopg import register_vector
+from pgvector.psycopg import hybrid_search, register_vector
 import psycopg
 from sentence_transformers import SentenceTransformer
 
@@ -21,32 +21,8 @@ embeddings = model.encode(sentences)
 for content, embedding in zip(sentences, embeddings):
     conn.execute('INSERT INTO documents (content, embedding) VALUES (%s, %s)', (content, embedding))
 
-sql = """
-WITH semantic_search AS (
-    SELECT id, RANK () OVER (ORDER BY embedding <=> %(embedding)s) AS rank
-    FROM documents
-    ORDER BY embedding <=> %(embedding)s
-    LIMIT 20
-),
-keyword_search AS (
-    SELECT id, RANK () OVER (ORDER BY ts_rank_cd(to_tsvector('english', content), query) DESC)
-    FROM documents, plainto_tsquery('english', %(query)s) query
-    WHERE to_tsvector('english', content) @@ query
-    ORDER BY ts_rank_cd(to_tsvector('english', content), query) DESC
-    LIMIT 20
-)
-SELECT
-    COALESCE(semantic_search.id, keyword_search.id) AS id,
-    COALESCE(1.0 / (%(k)s + semantic_search.rank), 0.0) +
-    COALESCE(1.0 / (%(k)s + keyword_search.rank), 0.0) AS score
-FROM semantic_search
-FULL OUTER JOIN keyword_search ON semantic_search.id = keyword_search.id
-ORDER BY score DESC
-LIMIT 5
-"""
 query = 'growling bear'
 embedding = model.encode(query)
-k = 60
-results = conn.execute(sql, {'query': query, 'embedding': embedding, 'k': k}).fetchall()
-for row in results:
-    print('document:', row[0], 'RRF score:', row[1])
+ids, scores = hybrid_search(conn, 'documents', 'embedding', 'content', embedding, query, limit=5, k=60)
+for id, score in zip(ids, scores):
+    print('document:', id, 'RRF score:', score)
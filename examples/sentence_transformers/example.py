@@ -1,4 +1,4 @@
-from pgvector.psycopg import register_vector
+from pgvector.psycopg import EmbeddingCache, register_vector
 import psycopg
 from sentence_transformers import SentenceTransformer
 
@@ -17,7 +17,11 @@ input = [
     'The cat is purring',
     'The bear is growling'
 ]
-embeddings = model.encode(input)
+
+# only embed content that has not been embedded before
+cache = EmbeddingCache(conn, 'embedding_cache', 384, model.encode)
+cache.create_table()
+embeddings = cache.get(input)
 for content, embedding in zip(input, embeddings):
     conn.execute('INSERT INTO documents (content, embedding) VALUES (%s, %s)', (content, embedding))
 
@@ -1,10 +1,18 @@
-from .register import register_vector
+from .matrix import column_matrix
+from .register import fetch_type_info, init_vector, register_vector
+from .search import PreparedNeighbors, batch_neighbors, concurrent_neighbors
 
 # TODO remove
 from .. import Vector, HalfVector, SparseVector
 
 __all__ = [
     'register_vector',
+    'init_vector',
+    'fetch_type_info',
+    'column_matrix',
+    'batch_neighbors',
+    'concurrent_neighbors',
+    'PreparedNeighbors',
     'Vector',
     'HalfVector',
     'SparseVector'
@@ -0,0 +1,6 @@
+import numpy as np
+from ..matrix import to_matrix
+
+
+def column_matrix(records, column, dtype=np.float32):
+    return to_matrix([record[column] for record in records], dtype)
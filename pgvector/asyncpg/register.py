@@ -1,31 +1,57 @@
+import numpy as np
+from struct import unpack_from
 from .. import Vector, HalfVector, SparseVector
 
+TYPE_INFO_SQL = "SELECT typname, pg_type.oid FROM pg_type INNER JOIN pg_namespace ON pg_namespace.oid = pg_type.typnamespace WHERE nspname = $1 AND typname IN ('vector', 'halfvec', 'sparsevec')"
 
-async def register_vector(conn, schema='public'):
-    await conn.set_type_codec(
-        'vector',
-        schema=schema,
-        encoder=Vector._to_db_binary,
-        decoder=Vector._from_db_binary,
-        format='binary'
-    )
+CODECS = {
+    'vector': (Vector._to_db_binary, Vector._from_db_binary),
+    'halfvec': (HalfVector._to_db_binary, HalfVector._from_db_binary),
+    'sparsevec': (SparseVector._to_db_binary, SparseVector._from_db_binary)
+}
 
+
+async def fetch_type_info(conn, schema='public'):
+    return dict(await conn.fetch(TYPE_INFO_SQL, schema))
+
+
+async def register_vector(conn, schema='public', type_info=None, halfvec_numpy=False):
+    if type_info is None:
+        type_info = await fetch_type_info(conn, schema)
+
+    if 'vector' not in type_info:
+        raise ValueError('unknown type: %s.vector' % schema)
+
+    for typename, oid in type_info.items():
+        encoder, decoder = CODECS[typename]
+        if typename == 'halfvec' and halfvec_numpy:
+            decoder = _halfvec_from_db_binary_numpy
+        await _set_type_codec(conn, typename, oid, schema, encoder, decoder)
+
+
+# fetch type info once and reuse it for every connection in the pool
+def init_vector(schema='public', halfvec_numpy=False):
+    type_info = None
+
+    async def init(conn):
+        nonlocal type_info
+        if type_info is None:
+            type_info = await fetch_type_info(conn, schema)
+        await register_vector(conn, schema, type_info, halfvec_numpy=halfvec_numpy)
+
+    return init
+
+
+def _halfvec_from_db_binary_numpy(value):
+    dim, unused = unpack_from('>HH', value)
+    return np.frombuffer(value, dtype='>f2', count=dim, offset=4).astype(np.float16)
+
+
+async def _set_type_codec(conn, typename, oid, schema, encoder, decoder):
     try:
-        await conn.set_type_codec(
-            'halfvec',
-            schema=schema,
-            encoder=HalfVector._to_db_binary,
-            decoder=HalfVector._from_db_binary,
-            format='binary'
-        )
-
-        await conn.set_type_codec(
-            'sparsevec',
-            schema=schema,
-            encoder=SparseVector._to_db_binary,
-            decoder=SparseVector._from_db_binary,
-            format='binary'
-        )
-    except ValueError as e:
-        if not str(e).startswith('unknown type:'):
-            raise e
+        # same as set_type_codec without the introspection query
+        conn._protocol.get_settings().add_python_codec(oid, typename, schema, [], 'scalar', encoder, decoder, 'binary')
+        conn._drop_local_statement_cache()
+    except (AttributeError, TypeError):
+        # asyncpg < 0.29 or private APIs that changed
+        await conn.set_type_codec(typename, schema=schema, encoder=encoder, decoder=decoder, format='binary')
@@ -0,0 +1,113 @@
+import asyncio
+from itertools import count
+import json
+import numpy as np
+from time import perf_counter
+from ..matrix import neighbor_arrays, to_vectors
+from ..operators import distance_operator
+
+_statement_ids = count()
+
+PREPARED_STATS_SQL = 'SELECT coalesce(sum(generic_plans), 0)::bigint, coalesce(sum(custom_plans), 0)::bigint FROM pg_prepared_statements WHERE starts_with(statement, $1)'
+
+
+def _quote_identifier(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _batch_neighbors_query(table, column, distance, id_column, where, k, type):
+    query = 'SELECT q.i, n.id, n.distance FROM unnest($1::%s[]) WITH ORDINALITY AS q (embedding, i) CROSS JOIN LATERAL (SELECT %s AS id, %s %s q.embedding AS distance FROM %s' % (
+        _quote_identifier(type),
+        _quote_identifier(id_column),
+        _quote_identifier(column),
+        distance_operator(distance),
+        _quote_identifier(table)
+    )
+    if where is not None:
+        query += ' WHERE ' + where
+    query += ' ORDER BY 2 LIMIT %d) n ORDER BY q.i, n.distance' % k
+    return query
+
+
+def _neighbors_query(table, column, distance, id_column, where, k):
+    query = 'SELECT %s, %s %s $1 FROM %s' % (
+        _quote_identifier(id_column),
+        _quote_identifier(column),
+        distance_operator(distance),
+        _quote_identifier(table)
+    )
+    if where is not None:
+        query += ' WHERE ' + where
+    query += ' ORDER BY 2 LIMIT %d' % k
+    return query
+
+
+# run one query for all query vectors with a lateral join
+# parameters in where start at $2
+async def batch_neighbors(conn, table, column, queries, k=10, distance='l2_distance', id_column='id', where=None, params=(), type='vector'):
+    # wrap rows so they are not encoded as a multidimensional array
+    queries = to_vectors(queries, type)
+    query = _batch_neighbors_query(table, column, distance, id_column, where, k, type)
+    rows = await conn.fetch(query, queries, *params)
+    return neighbor_arrays(rows, len(queries), k)
+
+
+# run searches concurrently over a pool with at most concurrency in flight
+# parameters in where start at $2
+async def concurrent_neighbors(pool, table, column, queries, k=10, distance='l2_distance', id_column='id', where=None, params=(), type='vector', concurrency=None):
+    queries = to_vectors(queries, type)
+    query = _neighbors_query(table, column, distance, id_column, where, k)
+    semaphore = asyncio.Semaphore(concurrency or pool.get_max_size())
+
+    async def search(value):
+        async with semaphore:
+            async with pool.acquire() as conn:
+                start = perf_counter()
+                rows = await conn.fetch(query, value, *params)
+                return rows, perf_counter() - start
+
+    results = await asyncio.gather(*[search(value) for value in queries])
+    rows = [(i, id, distance) for i, (result, _) in enumerate(results, 1) for id, distance in result]
+    ids, distances = neighbor_arrays(rows, len(queries), k)
+    timings = np.array([elapsed for _, elapsed in results], dtype=np.float64)
+    return ids, distances, timings
+
+
+# prepare a search once per connection and reuse the plan
+# parameters in where start at $2
+# planning time and stats require Postgres 14+
+class PreparedNeighbors:
+    def __init__(self, conn, table, column, k=10, distance='l2_distance', id_column='id', where=None):
+        self.conn = conn
+        self.name = 'pgvector_prepared_%d' % next(_statement_ids)
+        self.executions = 0
+        self.planning_time = None
+        # the comment identifies the statement in pg_prepared_statements
+        self._marker = '/* %s */' % self.name
+        self._query = self._marker + ' ' + _neighbors_query(table, column, distance, id_column, where, k)
+        self._statement = None
+        self._args = None
+
+    async def search(self, query, params=()):
+        if self._statement is None:
+            self._statement = await self.conn.prepare(self._query)
+        self._args = (query, *params)
+        rows = await self._statement.fetch(*self._args)
+        self.executions += 1
+        ids = np.array([row[0] for row in rows])
+        distances = np.array([row[1] for row in rows], dtype=np.float64)
+        return ids, distances
+
+    async def stats(self):
+        if self.planning_time is None and self._args is not None:
+            plan = json.loads(await self.conn.fetchval('EXPLAIN (SUMMARY, FORMAT JSON) ' + self._query, *self._args))
+            self.planning_time = plan[0]['Planning Time']
+        generic_plans, custom_plans = await self.conn.fetchrow(PREPARED_STATS_SQL, self._marker)
+        # generic plans reuse the cached plan instead of planning again
+        return {
+            'executions': self.executions,
+            'generic_plans': generic_plans,
+            'custom_plans': custom_plans,
+            'planning_time': self.planning_time,
+            'planning_time_saved': None if self.planning_time is None else self.planning_time * generic_plans
+        }
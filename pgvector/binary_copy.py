@@ -0,0 +1,62 @@
+import numpy as np
+from struct import pack
+from .bit import Bit
+from .halfvec import HalfVector
+from .sparsevec import SparseVector
+from .vector import Vector
+
+# pgvector types are sent as their binary representation with the bytea oid
+# so the driver does not need the types registered
+BYTEA_OID = 17
+
+ATTRIBUTE_TYPES_SQL = 'SELECT attname, atttypid::int FROM pg_attribute WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped'
+
+
+def _bit_to_db_binary(value):
+    if value is None:
+        return value
+
+    if not isinstance(value, Bit):
+        value = Bit(value)
+
+    return value.to_binary()
+
+
+BINARY_ENCODERS = {
+    'vector': Vector._to_db_binary,
+    'halfvec': HalfVector._to_db_binary,
+    'sparsevec': SparseVector._to_db_binary,
+    'bit': _bit_to_db_binary
+}
+
+# the binary format is a header followed by big-endian values
+MATRIX_DTYPES = {
+    'vector': '>f4',
+    'halfvec': '>f2'
+}
+
+
+def encode_column(type, values):
+    if type in MATRIX_DTYPES and isinstance(values, np.ndarray) and values.ndim == 2:
+        # encode the whole matrix instead of creating an object for each row
+        header = pack('>HH', values.shape[1], 0)
+        return [header + row.tobytes() for row in values.astype(MATRIX_DTYPES[type], copy=False)]
+
+    encoder = BINARY_ENCODERS[type]
+    return [encoder(value) for value in values]
+
+
+def binary_dumpable(adapters, oid):
+    from psycopg import ProgrammingError
+    from psycopg.pq import Format
+
+    # some known types, like bpchar and tsvector, only have text dumpers
+    try:
+        adapters.get_dumper_by_oid(oid, Format.BINARY)
+    except ProgrammingError:
+        return False
+    return True
+
+
+def copy_sql(table, columns):
+    return 'COPY %s (%s) FROM STDIN WITH (FORMAT BINARY)' % (table, ', '.join(columns))
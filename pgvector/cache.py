@@ -0,0 +1,97 @@
+from collections import OrderedDict
+from hashlib import blake2b
+import numpy as np
+from threading import Lock
+from time import monotonic
+from .bit import Bit
+from .halfvec import HalfVector
+from .operators import distance_operator
+from .sparsevec import SparseVector
+from .vector import Vector
+
+
+def _vector_bytes(value):
+    # encode the same way as the binary format so equal vectors share a key
+    if isinstance(value, HalfVector):
+        return HalfVector._to_db_binary(value)
+    elif isinstance(value, SparseVector):
+        return SparseVector._to_db_binary(value)
+    elif isinstance(value, Bit):
+        return Bit._to_db_binary(value)
+    return Vector._to_db_binary(value)
+
+
+def _update(h, value):
+    if isinstance(value, np.ndarray):
+        # repr truncates large arrays
+        h.update(repr((value.dtype.str, value.shape)).encode())
+        h.update(value.tobytes())
+    else:
+        h.update(repr(value).encode())
+    h.update(b'\x00')
+
+
+def neighbor_key(query, column, k, distance, where=None, params=(), id_column='id'):
+    h = blake2b(_vector_bytes(query), digest_size=16)
+    for value in (column, k, distance_operator(distance), where, id_column, *params):
+        _update(h, value)
+    return h.digest()
+
+
+class NeighborCache:
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, table, key):
+        with self._lock:
+            entry = self._entries.get((table, key))
+            if entry is None or (entry[0] is not None and entry[0] <= monotonic()):
+                if entry is not None:
+                    del self._entries[(table, key)]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end((table, key))
+            self.hits += 1
+            return entry[1]
+
+    def set(self, table, key, value):
+        # results are shared between callers
+        for arr in value:
+            arr.flags.writeable = False
+
+        expires = None if self.ttl is None else monotonic() + self.ttl
+        with self._lock:
+            self._entries[(table, key)] = (expires, value)
+            self._entries.move_to_end((table, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def invalidate(self, table=None):
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == table]:
+                    del self._entries[key]
+
+    def info(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'maxsize': self.maxsize
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,4 +1,5 @@
 from .bit import BitField
+from .bulk import VectorManager, VectorQuerySet
 from .extensions import VectorExtension
 from .functions import L2Distance, MaxInnerProduct, CosineDistance, L1Distance, HammingDistance, JaccardDistance
 from .halfvec import HalfVectorField
@@ -23,6 +24,8 @@ __all__ = [
     'L1Distance',
     'HammingDistance',
     'JaccardDistance',
+    'VectorManager',
+    'VectorQuerySet',
     'HalfVector',
     'SparseVector'
 ]
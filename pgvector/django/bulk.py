@@ -0,0 +1,121 @@
+from django.db import connections, models, transaction
+import numpy as np
+from ..binary_copy import ATTRIBUTE_TYPES_SQL, BYTEA_OID, binary_dumpable, copy_sql, encode_column
+from .bit import BitField
+from .halfvec import HalfVectorField
+from .sparsevec import SparseVectorField
+from .vector import VectorField
+
+TYPE_NAMES = {
+    VectorField: 'vector',
+    HalfVectorField: 'halfvec',
+    SparseVectorField: 'sparsevec',
+    BitField: 'bit'
+}
+
+
+def _field_class(field, classes):
+    for cls in classes:
+        if isinstance(field, cls):
+            return cls
+    return None
+
+
+def _copy_available(connection):
+    if connection.vendor != 'postgresql':
+        return False
+
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+    return is_psycopg3
+
+
+def _all_null(values):
+    return not isinstance(values, np.ndarray) and all(value is None for value in values)
+
+
+def _related_values(field, values):
+    # accept related objects or keys like the attname
+    if not field.many_to_one and not field.one_to_one:
+        return values
+    attname = field.target_field.attname
+    return [getattr(value, attname) if isinstance(value, models.Model) else value for value in values]
+
+
+def _encode(field, values, connection):
+    cls = _field_class(field, TYPE_NAMES)
+    if cls is None:
+        return [field.get_db_prep_save(value, connection) for value in values]
+    return encode_column(TYPE_NAMES[cls], values)
+
+
+class VectorQuerySet(models.QuerySet):
+    # objs are model instances or a dict of field names to columns, like NumPy arrays
+    # uses binary COPY with Psycopg 3 and bulk_create otherwise
+    # like bulk_create, save() is not called and signals are not sent
+    # unlike bulk_create, primary keys are not set on instances
+    def bulk_copy(self, objs, min_copy_rows=1000):
+        opts = self.model._meta
+        if opts.parents:
+            raise ValueError("Can't bulk copy a multi-table inherited model")
+
+        if isinstance(objs, dict):
+            fields = [opts.get_field(name) for name in objs]
+            columns = [_related_values(f, c) for f, c in zip(fields, objs.values())]
+            count = len(columns[0]) if columns else 0
+            for column in columns:
+                if len(column) != count:
+                    raise ValueError('expected %d values, not %d' % (count, len(column)))
+        else:
+            objs = list(objs)
+            fields = [f for f in opts.concrete_fields if not getattr(f, 'generated', False)]
+            columns = None
+            count = len(objs)
+
+        connection = connections[self.db]
+        if count < max(min_copy_rows, 1) or not _copy_available(connection):
+            return self._bulk_create(objs, fields, columns, count)
+
+        if isinstance(objs, dict):
+            # lists are faster to iterate than NumPy arrays
+            columns = [c.tolist() if isinstance(c, np.ndarray) and c.ndim == 1 else c for c in columns]
+        else:
+            # let the database generate keys like bulk_create
+            if any(obj.pk is None for obj in objs):
+                if not all(obj.pk is None for obj in objs):
+                    raise ValueError('expected all or no primary keys')
+                fields = [f for f in fields if f not in opts.db_returning_fields]
+            columns = [[f.pre_save(obj, True) for obj in objs] for f in fields]
+
+        quote_name = connection.ops.quote_name
+        table = quote_name(opts.db_table)
+        with transaction.atomic(using=self.db, savepoint=False):
+            with connection.cursor() as cursor:
+                cursor.execute(ATTRIBUTE_TYPES_SQL, [table])
+                oids = dict(cursor.fetchall())
+                # nulls are sent the same way for any type
+                types = [BYTEA_OID if _field_class(f, TYPE_NAMES) or _all_null(c) else oids[f.column] for f, c in zip(fields, columns)]
+
+                # fall back for types that Psycopg cannot dump in binary and arrays
+                # of vectors, which ArrayField prepares as text
+                adapters = connection.connection.adapters
+                if any(oid != BYTEA_OID and (not binary_dumpable(adapters, oid) or _field_class(getattr(f, 'base_field', None), TYPE_NAMES)) for f, oid in zip(fields, types)):
+                    return self._bulk_create(objs, fields, columns, count)
+
+                columns = [_encode(f, c, connection) for f, c in zip(fields, columns)]
+                with cursor.copy(copy_sql(table, [quote_name(f.column) for f in fields])) as copy:
+                    copy.set_types(types)
+                    for row in zip(*columns):
+                        copy.write_row(row)
+
+        return count
+
+    def _bulk_create(self, objs, fields, columns, count):
+        if isinstance(objs, dict):
+            names = [f.attname for f in fields]
+            objs = [self.model(**dict(zip(names, row))) for row in zip(*columns)]
+        if objs:
+            self.bulk_create(objs)
+        return count
+
+
+VectorManager = models.Manager.from_queryset(VectorQuerySet, 'VectorManager')
@@ -0,0 +1,122 @@
+import numpy as np
+from .bit import Bit
+from .matrix import to_matrix
+from .operators import distance_operator
+
+# bound temporary arrays to about 32 MB of float64
+MAX_ELEMENTS = 1 << 22
+
+BIT_OPERATORS = ('<~>', '<%>')
+
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+
+def _float_matrix(values):
+    if isinstance(values, np.ndarray) and values.ndim == 2:
+        return values.astype(np.float64)
+    return to_matrix(values, np.float64)
+
+
+def _bit_matrix(values):
+    if isinstance(values, np.ndarray) and values.ndim == 2:
+        if values.dtype != np.uint8:
+            values = np.packbits(values.astype(bool), axis=1)
+        return values
+
+    rows = [v.to_numpy() if isinstance(v, Bit) else np.asarray(v, dtype=bool) for v in values]
+    if len(rows) == 0:
+        return np.empty((0, 0), dtype=np.uint8)
+    dim = len(rows[0])
+    for row in rows:
+        if len(row) != dim:
+            raise ValueError('expected %d dimensions, not %d' % (dim, len(row)))
+    return np.packbits(np.array(rows), axis=1)
+
+
+def _pairwise(queries, data, fn):
+    # apply fn to slices of data so the (queries, rows, dimensions) array stays bounded
+    step = max(1, MAX_ELEMENTS // max(1, len(queries) * data.shape[1]))
+    result = np.empty((len(queries), len(data)), dtype=np.float64)
+    for start in range(0, len(data), step):
+        result[:, start:start + step] = fn(queries[:, None, :], data[None, start:start + step, :])
+    return result
+
+
+def _distances(queries, data, operator):
+    if queries.shape[1] != data.shape[1]:
+        raise ValueError('different dimensions %d and %d' % (queries.shape[1], data.shape[1]))
+
+    if operator == '<->':
+        return np.sqrt(_pairwise(queries, data, lambda q, x: np.square(q - x).sum(axis=2)))
+    elif operator == '<#>':
+        return -(queries @ data.T)
+    elif operator == '<=>':
+        norms = np.sqrt(np.outer(np.square(queries).sum(axis=1), np.square(data).sum(axis=1)))
+        # zero vectors have no direction and give NaN like Postgres
+        with np.errstate(divide='ignore', invalid='ignore'):
+            similarity = (queries @ data.T) / norms
+        return 1 - np.clip(similarity, -1, 1)
+    elif operator == '<+>':
+        return _pairwise(queries, data, lambda q, x: np.abs(q - x).sum(axis=2))
+    elif operator == '<~>':
+        return _pairwise(queries, data, lambda q, x: _POPCOUNT[q ^ x].sum(axis=2))
+    else:
+        ab = _pairwise(queries, data, lambda q, x: _POPCOUNT[q & x].sum(axis=2))
+        a = _POPCOUNT[queries].sum(axis=1)[:, None]
+        b = _POPCOUNT[data].sum(axis=1)[None, :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(ab == 0, 1.0, 1 - ab / (a + b - ab))
+
+
+def _prepare(data, queries, distance):
+    operator = distance_operator(distance)
+    if operator in BIT_OPERATORS:
+        return _bit_matrix(data), _bit_matrix(queries), operator
+    return _float_matrix(data), _float_matrix(queries), operator
+
+
+# same semantics as the SQL operators, computed in double precision
+# (Postgres sums in single precision, so results can differ in the last bits)
+def exact_distances(data, queries, distance='l2_distance'):
+    data, queries, operator = _prepare(data, queries, distance)
+    return _distances(queries, data, operator)
+
+
+def exact_neighbors(data, queries, k=10, distance='l2_distance', ids=None, chunk_size=None):
+    data, queries, operator = _prepare(data, queries, distance)
+    n = len(queries)
+    m = len(data)
+
+    if ids is None:
+        ids = np.arange(m, dtype=np.int64)
+    else:
+        ids = np.asarray(ids)
+        if len(ids) != m:
+            raise ValueError('expected %d ids, not %d' % (m, len(ids)))
+
+    if chunk_size is None:
+        chunk_size = max(1, MAX_ELEMENTS // max(1, m))
+
+    if ids.dtype.kind in 'iu':
+        neighbor_ids = np.full((n, k), -1, dtype=np.int64)
+    else:
+        neighbor_ids = np.full((n, k), None, dtype=object)
+    neighbor_distances = np.full((n, k), np.inf, dtype=np.float64)
+
+    kk = min(k, m)
+    if kk == 0:
+        return neighbor_ids, neighbor_distances
+
+    for start in range(0, n, chunk_size):
+        distances = _distances(queries[start:start + chunk_size], data, operator)
+        if kk < m:
+            # NaN distances sort last like Postgres
+            candidates = np.argpartition(distances, kk - 1, axis=1)[:, :kk]
+        else:
+            candidates = np.broadcast_to(np.arange(m), distances.shape)
+        order = np.argsort(np.take_along_axis(distances, candidates, axis=1), axis=1, kind='stable')
+        indices = np.take_along_axis(candidates, order, axis=1)
+
+        neighbor_ids[start:start + chunk_size, :kk] = ids[indices]
+        neighbor_distances[start:start + chunk_size, :kk] = np.take_along_axis(distances, indices, axis=1)
+    return neighbor_ids, neighbor_distances
@@ -0,0 +1,75 @@
+import numpy as np
+
+METHODS = ('rrf', 'score')
+
+
+def _present(ids, scores):
+    # results are padded with -1 or None ids and inf distances
+    if ids.dtype == object:
+        present = np.array([id is not None for id in ids], dtype=bool)
+    elif ids.dtype.kind in 'iu':
+        present = ids != -1
+    else:
+        present = np.ones(len(ids), dtype=bool)
+    return present & np.isfinite(scores)
+
+
+def _contribution(scores, method, k, weight):
+    if method == 'rrf':
+        return weight / (k + np.arange(1, len(scores) + 1, dtype=np.float64))
+
+    if len(scores) == 0:
+        return scores
+    low = scores.min()
+    high = scores.max()
+    if high == low:
+        return np.full(len(scores), float(weight))
+    return weight * (scores - low) / (high - low)
+
+
+# fuse results of retrievers that run separately, like on different connections
+# ids are ordered best first and scores are higher for better results (pass -distances for distances)
+# padding, like -1 ids and inf distances from exact_neighbors, is skipped
+# matches fusion_query for Psycopg 3 and SQLAlchemy
+def fuse(ids, scores=None, method='rrf', k=60, weights=None, limit=None):
+    if method not in METHODS:
+        raise ValueError('unknown method: %s' % method)
+    if weights is None:
+        weights = [1] * len(ids)
+    if len(weights) != len(ids):
+        raise ValueError('expected %d weights, not %d' % (len(ids), len(weights)))
+    if scores is None:
+        if method == 'score':
+            raise ValueError('score method requires scores')
+        scores = [None] * len(ids)
+    if len(scores) != len(ids):
+        raise ValueError('expected %d scores, not %d' % (len(ids), len(scores)))
+
+    all_ids = []
+    contributions = []
+    for retriever_ids, retriever_scores, weight in zip(ids, scores, weights):
+        retriever_ids = np.asarray(retriever_ids)
+        if retriever_scores is None:
+            retriever_scores = np.zeros(len(retriever_ids), dtype=np.float64)
+        else:
+            retriever_scores = np.asarray(retriever_scores, dtype=np.float64)
+            if len(retriever_scores) != len(retriever_ids):
+                raise ValueError('expected %d scores, not %d' % (len(retriever_ids), len(retriever_scores)))
+
+        present = _present(retriever_ids, retriever_scores)
+        retriever_ids = retriever_ids[present]
+        all_ids.append(retriever_ids)
+        contributions.append(_contribution(retriever_scores[present], method, k, weight))
+
+    if sum(len(v) for v in all_ids) == 0:
+        return np.array([]), np.array([], dtype=np.float64)
+
+    # sum the contributions of each id without a Python dict
+    unique, inverse = np.unique(np.concatenate(all_ids), return_inverse=True)
+    totals = np.bincount(inverse.reshape(-1), weights=np.concatenate(contributions), minlength=len(unique))
+
+    # unique ids are sorted, so a stable sort breaks ties by id like the SQL
+    order = np.argsort(-totals, kind='stable')
+    if limit is not None:
+        order = order[:limit]
+    return unique[order], totals[order]
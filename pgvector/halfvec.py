@@ -1,6 +1,16 @@
 import numpy as np
 from struct import pack, unpack_from
 
+# text for each of the 65536 half-precision values, created on first use
+_text_table = None
+
+
+def _text(bits):
+    global _text_table
+    if _text_table is None:
+        _text_table = [str(v) for v in np.arange(65536, dtype=np.uint16).view(np.float16).astype(np.float64).tolist()]
+    return map(_text_table.__getitem__, bits)
+
 
 class HalfVector:
     def __init__(self, value):
@@ -31,7 +41,8 @@ class HalfVector:
         return self._value
 
     def to_text(self):
-        return '[' + ','.join([str(float(v)) for v in self._value]) + ']'
+        # look up by bit pattern instead of formatting each float
+        return '[' + ','.join(_text(self._value.view('>u2').tolist())) + ']'
 
     def to_binary(self):
         return pack('>HH', self.dimensions(), 0) + self._value.tobytes()
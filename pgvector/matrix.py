@@ -0,0 +1,63 @@
+import numpy as np
+from .bit import Bit
+from .halfvec import HalfVector
+from .sparsevec import SparseVector
+from .vector import Vector
+
+VECTOR_CLASSES = {
+    'vector': Vector,
+    'halfvec': HalfVector,
+    'bit': Bit,
+    'sparsevec': SparseVector
+}
+
+
+def dimensions(value):
+    if isinstance(value, (Vector, HalfVector, SparseVector)):
+        return value.dimensions()
+    return len(value)
+
+
+def to_vectors(values, type='vector'):
+    cls = VECTOR_CLASSES[type]
+    return [value if isinstance(value, cls) else cls(value) for value in values]
+
+
+def to_matrix(values, dtype=np.float32):
+    if len(values) == 0:
+        return np.empty((0, 0), dtype=dtype)
+
+    if values[0] is None:
+        raise ValueError('expected non-null values')
+    dim = dimensions(values[0])
+
+    # fill a single preallocated matrix instead of stacking row arrays
+    matrix = np.empty((len(values), dim), dtype=dtype)
+    for i, value in enumerate(values):
+        if value is None:
+            raise ValueError('expected non-null values')
+        if isinstance(value, (Vector, HalfVector, SparseVector)):
+            value = value.to_numpy()
+        if len(value) != dim:
+            raise ValueError('expected %d dimensions, not %d' % (dim, len(value)))
+        matrix[i] = value
+    return matrix
+
+
+def neighbor_arrays(rows, n, k):
+    # rows are (query number starting at 1, id, distance) ordered by query and distance
+    rows = list(rows)
+    if len(rows) > 0 and not isinstance(rows[0][1], int):
+        ids = np.full((n, k), None, dtype=object)
+    else:
+        ids = np.full((n, k), -1, dtype=np.int64)
+    distances = np.full((n, k), np.inf, dtype=np.float64)
+
+    counts = [0] * n
+    for i, id, distance in rows:
+        i -= 1
+        j = counts[i]
+        ids[i, j] = id
+        distances[i, j] = distance
+        counts[i] = j + 1
+    return ids, distances
@@ -0,0 +1,18 @@
+DISTANCE_OPERATORS = {
+    'l2_distance': '<->',
+    'max_inner_product': '<#>',
+    'cosine_distance': '<=>',
+    'l1_distance': '<+>',
+    'hamming_distance': '<~>',
+    'jaccard_distance': '<%>'
+}
+
+
+def distance_operator(distance):
+    if distance in DISTANCE_OPERATORS.values():
+        return distance
+
+    if distance not in DISTANCE_OPERATORS:
+        raise ValueError('unknown distance: %s' % distance)
+
+    return DISTANCE_OPERATORS[distance]
@@ -1,5 +1,6 @@
-from .register import register_vector
+from .register import fetch_type_info, register_vector
 
 __all__ = [
-    'register_vector'
+    'register_vector',
+    'fetch_type_info'
 ]
@@ -2,10 +2,15 @@ import numpy as np
 from .. import Vector, HalfVector, SparseVector
 
 
-def register_vector(conn):
+def fetch_type_info(conn):
     # use to_regtype to get first matching type in search path
     res = conn.run("SELECT typname, oid FROM pg_type WHERE oid IN (to_regtype('vector'), to_regtype('halfvec'), to_regtype('sparsevec'))")
-    type_info = dict(res)
+    return dict(res)
+
+
+def register_vector(conn, type_info=None):
+    if type_info is None:
+        type_info = fetch_type_info(conn)
 
     if 'vector' not in type_info:
         raise RuntimeError('vector type not found in the database')
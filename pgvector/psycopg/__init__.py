@@ -1,4 +1,8 @@
-from .register import register_vector, register_vector_async
+from .embedding_cache import EmbeddingCache
+from .hybrid import fused_search, fusion_query, hybrid_search, text_retriever, vector_retriever
+from .register import configure_vector, configure_vector_async, fetch_type_info, fetch_type_info_async, register_vector, register_vector_async
+from .tuning import tune_search
+from .search import AsyncPreparedNeighbors, PreparedNeighbors, batch_neighbors, batch_neighbors_async, cached_neighbors, concurrent_neighbors, pipeline_neighbors, pipeline_neighbors_async, stream_neighbors, stream_neighbors_async
 
 # TODO remove
 from .. import Bit, HalfVector, SparseVector, Vector
@@ -6,6 +10,27 @@ from .. import Bit, HalfVector, SparseVector, Vector
 __all__ = [
     'register_vector',
     'register_vector_async',
+    'configure_vector',
+    'configure_vector_async',
+    'fetch_type_info',
+    'fetch_type_info_async',
+    'batch_neighbors',
+    'batch_neighbors_async',
+    'cached_neighbors',
+    'concurrent_neighbors',
+    'pipeline_neighbors',
+    'pipeline_neighbors_async',
+    'stream_neighbors',
+    'stream_neighbors_async',
+    'PreparedNeighbors',
+    'AsyncPreparedNeighbors',
+    'tune_search',
+    'hybrid_search',
+    'fused_search',
+    'fusion_query',
+    'vector_retriever',
+    'text_retriever',
+    'EmbeddingCache',
     'Vector',
     'HalfVector',
     'Bit',
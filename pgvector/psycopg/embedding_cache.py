@@ -0,0 +1,110 @@
+from collections import OrderedDict
+from hashlib import sha256
+from itertools import count
+import numpy as np
+from psycopg import sql
+from psycopg.rows import tuple_row
+from ..matrix import to_matrix, to_vectors
+from .search import _identifier
+
+_staging_ids = count()
+
+
+def _content_hash(content):
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return sha256(content).digest()
+
+
+# look up embeddings by content hash and only compute the misses
+# use a table per model since the hash only covers the content
+class EmbeddingCache:
+    def __init__(self, conn, table, dimensions, embed, type='vector', maxsize=10000):
+        self.conn = conn
+        self.table = _identifier(table)
+        self.dimensions = dimensions
+        self.embed = embed
+        self.type = type
+        self.maxsize = maxsize
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._staging = sql.Identifier('pgvector_embedding_staging_%d' % next(_staging_ids))
+
+    def create_table(self):
+        self.conn.execute(sql.SQL('CREATE TABLE IF NOT EXISTS {} (content_hash bytea PRIMARY KEY, embedding {}({}))').format(self.table, sql.Identifier(self.type), sql.Literal(self.dimensions)))
+
+    def get(self, contents):
+        contents = list(contents)
+        hashes = [_content_hash(content) for content in contents]
+        found = {}
+        missing = []
+        for h in dict.fromkeys(hashes):
+            if h in self._entries:
+                self._entries.move_to_end(h)
+                found[h] = self._entries[h]
+                self.hits += 1
+            else:
+                missing.append(h)
+
+        if missing:
+            found.update(self._fetch(missing))
+
+            # keep order of first occurrence for the callback
+            pending = {}
+            for h, content in zip(hashes, contents):
+                if h not in found:
+                    pending.setdefault(h, content)
+
+            if pending:
+                embeddings = to_matrix(list(self.embed(list(pending.values()))))
+                if embeddings.shape != (len(pending), self.dimensions):
+                    raise ValueError('expected %d embeddings with %d dimensions, not %s' % (len(pending), self.dimensions, embeddings.shape))
+                self._store(list(pending), embeddings)
+                found.update(zip(pending, embeddings))
+                self.misses += len(pending)
+
+            for h in missing:
+                self._remember(h, found[h])
+
+        matrix = np.empty((len(hashes), self.dimensions), dtype=np.float32)
+        for i, h in enumerate(hashes):
+            matrix[i] = found[h]
+        return matrix
+
+    def info(self):
+        lookups = self.hits + self.db_hits + self.misses
+        return {
+            'hits': self.hits,
+            'db_hits': self.db_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.db_hits) / lookups if lookups else 0.0,
+            'size': len(self._entries),
+            'maxsize': self.maxsize
+        }
+
+    def _fetch(self, hashes):
+        # one query per batch
+        query = sql.SQL('SELECT content_hash, embedding FROM {} WHERE content_hash = ANY(%s)').format(self.table)
+        with self.conn.cursor(binary=True, row_factory=tuple_row) as cur:
+            cur.execute(query, (hashes,))
+            rows = cur.fetchall()
+
+        self.db_hits += len(rows)
+        return dict(zip([row[0] for row in rows], to_matrix([row[1] for row in rows])))
+
+    def _store(self, hashes, embeddings):
+        with self.conn.transaction(), self.conn.cursor() as cur:
+            # copy to a staging table so concurrent writers do not conflict
+            cur.execute(sql.SQL('CREATE TEMPORARY TABLE IF NOT EXISTS {} (LIKE {}) ON COMMIT DELETE ROWS').format(self._staging, self.table))
+            with cur.copy(sql.SQL('COPY {} (content_hash, embedding) FROM STDIN WITH (FORMAT BINARY)').format(self._staging)) as copy:
+                copy.set_types(['bytea', self.type])
+                for h, embedding in zip(hashes, to_vectors(embeddings, self.type)):
+                    copy.write_row([h, embedding])
+            cur.execute(sql.SQL('INSERT INTO {} SELECT * FROM {} ON CONFLICT DO NOTHING').format(self.table, self._staging))
+
+    def _remember(self, h, embedding):
+        self._entries[h] = embedding
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
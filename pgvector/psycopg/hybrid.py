@@ -0,0 +1,75 @@
+from psycopg import sql
+from psycopg.rows import tuple_row
+from ..matrix import to_vectors
+from .search import _batch, _fragment, _identifier, _operator
+
+METHODS = ('rrf', 'score')
+
+
+def _filter(where, keyword):
+    if where is None:
+        return sql.SQL('')
+    return sql.SQL(' {} (').format(sql.SQL(keyword)) + _fragment(where) + sql.SQL(')')
+
+
+# retrievers are (query, params) pairs for fusion_query
+# the query returns id, rank starting at 1, and score where higher is better
+def vector_retriever(table, column, embedding, distance='cosine_distance', id_column='id', where=None, params=(), type='vector', candidates=20):
+    embedding = to_vectors([embedding], type)[0]
+    # rank the candidates so the distance is only computed once
+    query = sql.SQL('SELECT id, row_number() OVER (ORDER BY distance) AS rank, -distance AS score FROM (SELECT {} AS id, {} {} %s AS distance FROM {}{} ORDER BY distance LIMIT {}) s').format(
+        _identifier(id_column), _identifier(column), _operator(distance), _identifier(table), _filter(where, 'WHERE'), sql.Literal(int(candidates))
+    )
+    return query, (embedding, *params)
+
+
+def text_retriever(table, text_column, query, language='english', id_column='id', where=None, params=(), candidates=20):
+    language = sql.SQL('{}::regconfig').format(sql.Literal(language))
+    document = sql.SQL('to_tsvector({}, {})').format(language, _identifier(text_column))
+    sql_query = sql.SQL('SELECT id, row_number() OVER (ORDER BY score DESC) AS rank, score FROM (SELECT {} AS id, ts_rank_cd({}, query) AS score FROM {}, plainto_tsquery({}, %s) query WHERE {} @@ query{} ORDER BY score DESC LIMIT {}) s').format(
+        _identifier(id_column), document, _identifier(table), language, document, _filter(where, 'AND'), sql.Literal(int(candidates))
+    )
+    return sql_query, (query, *params)
+
+
+# fuse any number of retrievers in one statement
+# rrf adds weight / (k + rank) and score adds weight * score scaled to [0, 1] for each retriever
+def fusion_query(retrievers, method='rrf', k=60, weights=None, limit=10):
+    if method not in METHODS:
+        raise ValueError('unknown method: %s' % method)
+    if weights is None:
+        weights = [1] * len(retrievers)
+    if len(weights) != len(retrievers):
+        raise ValueError('expected %d weights, not %d' % (len(retrievers), len(weights)))
+
+    if method == 'rrf':
+        contribution = sql.SQL('{} / ({} + rank)')
+    else:
+        contribution = sql.SQL('{} * coalesce((score - min(score) OVER ()) / nullif(max(score) OVER () - min(score) OVER (), 0), 1)')
+
+    parts = []
+    params = []
+    for (query, retriever_params), weight in zip(retrievers, weights):
+        part = sql.SQL('SELECT id, {} AS score FROM ({}) r').format(contribution.format(sql.Literal(float(weight)), sql.Literal(int(k))), _fragment(query))
+        parts.append(part)
+        params.extend(retriever_params)
+
+    query = sql.SQL('SELECT id, sum(score) AS score FROM ({}) f GROUP BY id ORDER BY 2 DESC, 1 LIMIT {}').format(sql.SQL(' UNION ALL ').join(parts), sql.Literal(int(limit)))
+    return query, params
+
+
+def fused_search(conn, retrievers, method='rrf', k=60, weights=None, limit=10):
+    query, params = fusion_query(retrievers, method, k, weights, limit)
+    with conn.cursor(binary=True, row_factory=tuple_row) as cur:
+        cur.execute(query, params)
+        ids, scores, _ = _batch(cur.fetchall(), False)
+    return ids, scores
+
+
+# combine vector and full-text search with reciprocal rank fusion in one query
+def hybrid_search(conn, table, column, text_column, embedding, query, limit=10, distance='cosine_distance', id_column='id', where=None, params=(), type='vector', language='english', k=60, weights=(1, 1), candidates=20):
+    retrievers = [
+        vector_retriever(table, column, embedding, distance, id_column, where, params, type, candidates),
+        text_retriever(table, text_column, query, language, id_column, where, params, candidates)
+    ]
+    return fused_search(conn, retrievers, 'rrf', k, weights, limit)
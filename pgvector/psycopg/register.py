@@ -1,37 +1,83 @@
+from psycopg import AsyncCursor, Cursor
+from psycopg.rows import tuple_row
 from psycopg.types import TypeInfo
 from .bit import register_bit_info
 from .halfvec import register_halfvec_info
 from .sparsevec import register_sparsevec_info
 from .vector import register_vector_info
 
+# use to_regtype to get first matching type in search path
+TYPE_INFO_SQL = "SELECT typname, oid, typarray, oid::regtype::text, typdelim FROM pg_type WHERE oid IN (to_regtype('vector'), to_regtype('bit'), to_regtype('halfvec'), to_regtype('sparsevec'))"
 
-def register_vector(context):
-    info = TypeInfo.fetch(context, 'vector')
-    register_vector_info(context, info)
 
-    info = TypeInfo.fetch(context, 'bit')
-    register_bit_info(context, info)
+# names are returned as bytes with SQL_ASCII, so use utf8 for the query like TypeInfo.fetch
+UTF8_SQL = 'SET LOCAL client_encoding TO utf8'
 
-    info = TypeInfo.fetch(context, 'halfvec')
-    if info is not None:
-        register_halfvec_info(context, info)
 
-    info = TypeInfo.fetch(context, 'sparsevec')
-    if info is not None:
-        register_sparsevec_info(context, info)
+def fetch_type_info(conn):
+    # leave the connection in the transaction state it was found in
+    with conn.transaction(), Cursor(conn, row_factory=tuple_row) as cur:
+        if conn.info.encoding == 'ascii':
+            cur.execute(UTF8_SQL)
+        cur.execute(TYPE_INFO_SQL)
+        return _type_info(cur.fetchall())
 
 
-async def register_vector_async(context):
-    info = await TypeInfo.fetch(context, 'vector')
-    register_vector_info(context, info)
+async def fetch_type_info_async(conn):
+    async with conn.transaction(), AsyncCursor(conn, row_factory=tuple_row) as cur:
+        if conn.info.encoding == 'ascii':
+            await cur.execute(UTF8_SQL)
+        await cur.execute(TYPE_INFO_SQL)
+        return _type_info(await cur.fetchall())
 
-    info = await TypeInfo.fetch(context, 'bit')
-    register_bit_info(context, info)
 
-    info = await TypeInfo.fetch(context, 'halfvec')
-    if info is not None:
-        register_halfvec_info(context, info)
+def _type_info(rows):
+    return {name: TypeInfo(name, oid, array_oid, regtype=regtype, delimiter=delimiter) for name, oid, array_oid, regtype, delimiter in rows}
 
-    info = await TypeInfo.fetch(context, 'sparsevec')
-    if info is not None:
-        register_sparsevec_info(context, info)
+
+def _register_type_info(context, type_info):
+    register_vector_info(context, type_info.get('vector'))
+    register_bit_info(context, type_info['bit'])
+
+    if 'halfvec' in type_info:
+        register_halfvec_info(context, type_info['halfvec'])
+
+    if 'sparsevec' in type_info:
+        register_sparsevec_info(context, type_info['sparsevec'])
+
+
+def register_vector(context, type_info=None):
+    if type_info is None:
+        type_info = fetch_type_info(context)
+    _register_type_info(context, type_info)
+
+
+# fetch type info once and reuse it for every connection in the pool
+def configure_vector():
+    type_info = None
+
+    def configure(conn):
+        nonlocal type_info
+        if type_info is None:
+            type_info = fetch_type_info(conn)
+        _register_type_info(conn, type_info)
+
+    return configure
+
+
+async def register_vector_async(context, type_info=None):
+    if type_info is None:
+        type_info = await fetch_type_info_async(context)
+    _register_type_info(context, type_info)
+
+
+def configure_vector_async():
+    type_info = None
+
+    async def configure(conn):
+        nonlocal type_info
+        if type_info is None:
+            type_info = await fetch_type_info_async(conn)
+        _register_type_info(conn, type_info)
+
+    return configure
@@ -0,0 +1,315 @@
+import asyncio
+import json
+from itertools import count
+import numpy as np
+from time import perf_counter
+from psycopg import sql
+from psycopg.rows import tuple_row
+from .. import Bit
+from ..cache import neighbor_key
+from ..matrix import dimensions, neighbor_arrays, to_matrix, to_vectors
+from ..operators import distance_operator
+
+_cursor_ids = count()
+_statement_ids = count()
+
+PREPARED_STATS_SQL = 'SELECT coalesce(sum(generic_plans), 0)::bigint, coalesce(sum(custom_plans), 0)::bigint FROM pg_prepared_statements WHERE starts_with(statement, %s)'
+
+
+def _identifier(name):
+    if isinstance(name, sql.Composable):
+        return name
+    return sql.Identifier(name)
+
+
+def _fragment(value):
+    if isinstance(value, sql.Composable):
+        return value
+    return sql.SQL(value)
+
+
+def _operator(distance):
+    # escape % in <%> so it is not read as a placeholder
+    return sql.SQL(distance_operator(distance).replace('%', '%%'))
+
+
+def _neighbors_query(table, column, distance, id_column, where, limit, vectors, placeholder='%s'):
+    fields = [
+        _identifier(id_column),
+        sql.SQL('{} {} {}').format(_identifier(column), _operator(distance), sql.SQL(placeholder))
+    ]
+    if vectors:
+        fields.append(_identifier(column))
+
+    query = sql.SQL('SELECT {} FROM {}').format(sql.SQL(', ').join(fields), _identifier(table))
+    if where is not None:
+        query += sql.SQL(' WHERE ') + _fragment(where)
+    # order by position to avoid evaluating the distance twice
+    query += sql.SQL(' ORDER BY 2')
+    if limit is not None:
+        query += sql.SQL(' LIMIT {}').format(sql.Literal(int(limit)))
+    return query
+
+
+def _batch_neighbors_query(table, column, distance, id_column, where, k, type):
+    query = sql.SQL('SELECT q.i, n.id, n.distance FROM unnest(%s::{}[]) WITH ORDINALITY AS q (embedding, i) CROSS JOIN LATERAL (SELECT {} AS id, {} {} q.embedding AS distance FROM {}').format(
+        _identifier(type),
+        _identifier(id_column),
+        _identifier(column),
+        _operator(distance),
+        _identifier(table)
+    )
+    if where is not None:
+        query += sql.SQL(' WHERE ') + _fragment(where)
+    query += sql.SQL(' ORDER BY 2 LIMIT {}) n ORDER BY q.i, n.distance').format(sql.Literal(int(k)))
+    return query
+
+
+def _batch_size(query, vectors):
+    if not vectors:
+        return 10000
+
+    # bits are packed into bytes
+    if isinstance(query, Bit):
+        row_bytes = (query._len + 7) // 8
+    else:
+        row_bytes = 4 * dimensions(query)
+
+    # aim for about 4 MB of vectors per fetch
+    return max(100, min(10000, (4 << 20) // max(row_bytes, 1)))
+
+
+def _bit_data(value):
+    if value is None:
+        raise ValueError('expected non-null values')
+    if isinstance(value, Bit):
+        return value._data
+    # binary format without a loader is the length followed by the data
+    return value[4:]
+
+
+def _packed_matrix(values):
+    # rows of bytes like np.packbits
+    data = [_bit_data(value) for value in values]
+    for v in data:
+        if len(v) != len(data[0]):
+            raise ValueError('expected %d bytes, not %d' % (len(data[0]), len(v)))
+    return np.frombuffer(b''.join(data), dtype=np.uint8).reshape(len(values), -1)
+
+
+def _batch(rows, vectors):
+    ids = np.array([row[0] for row in rows])
+    distances = np.array([row[1] for row in rows], dtype=np.float64)
+    matrix = None
+    if vectors:
+        values = [row[2] for row in rows]
+        matrix = _packed_matrix(values) if values and isinstance(values[0], (Bit, bytes)) else to_matrix(values)
+    return ids, distances, matrix
+
+
+def stream_neighbors(conn, table, column, query, distance='l2_distance', id_column='id', where=None, params=(), limit=None, vectors=True, batch_size=None):
+    if batch_size is None:
+        batch_size = _batch_size(query, vectors)
+
+    sql_query = _neighbors_query(table, column, distance, id_column, where, limit, vectors)
+
+    # server-side cursors require a transaction
+    with conn.transaction():
+        with conn.cursor('pgvector_stream_%d' % next(_cursor_ids), binary=True, row_factory=tuple_row) as cur:
+            cur.itersize = batch_size
+            cur.execute(sql_query, (query, *params))
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield _batch(rows, vectors)
+
+
+async def stream_neighbors_async(conn, table, column, query, distance='l2_distance', id_column='id', where=None, params=(), limit=None, vectors=True, batch_size=None):
+    if batch_size is None:
+        batch_size = _batch_size(query, vectors)
+
+    sql_query = _neighbors_query(table, column, distance, id_column, where, limit, vectors)
+
+    async with conn.transaction():
+        async with conn.cursor('pgvector_stream_%d' % next(_cursor_ids), binary=True, row_factory=tuple_row) as cur:
+            cur.itersize = batch_size
+            await cur.execute(sql_query, (query, *params))
+            while True:
+                rows = await cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield _batch(rows, vectors)
+
+
+# run one query for all query vectors with a lateral join
+def batch_neighbors(conn, table, column, queries, k=10, distance='l2_distance', id_column='id', where=None, params=(), type='vector'):
+    # wrap rows so they are not encoded as a multidimensional array
+    queries = to_vectors(queries, type)
+    sql_query = _batch_neighbors_query(table, column, distance, id_column, where, k, type)
+    with conn.cursor(binary=True, row_factory=tuple_row) as cur:
+        cur.execute(sql_query, (queries, *params))
+        return neighbor_arrays(cur.fetchall(), len(queries), k)
+
+
+async def batch_neighbors_async(conn, table, column, queries, k=10, distance='l2_distance', id_column='id', where=None, params=(), type='vector'):
+    # wrap rows so they are not encoded as a multidimensional array
+    queries = to_vectors(queries, type)
+    sql_query = _batch_neighbors_query(table, column, distance, id_column, where, k, type)
+    async with conn.cursor(binary=True, row_factory=tuple_row) as cur:
+        await cur.execute(sql_query, (queries, *params))
+        return neighbor_arrays(await cur.fetchall(), len(queries), k)
+
+
+# reuse results for repeated searches
+# call cache.invalidate(table) after the table changes
+def cached_neighbors(conn, cache, table, column, query, k=10, distance='l2_distance', id_column='id', where=None, params=(), type='vector'):
+    query = to_vectors([query], type)[0]
+    key = neighbor_key(query, column, k, distance, where, params, id_column)
+    result = cache.get(table, key)
+    if result is None:
+        sql_query = _neighbors_query(table, column, distance, id_column, where, k, False)
+        with conn.cursor(binary=True, row_factory=tuple_row) as cur:
+            cur.execute(sql_query, (query, *params))
+            ids, distances, _ = _batch(cur.fetchall(), False)
+        result = cache.set(table, key, (ids, distances))
+    return result
+
+
+def _search(conn, cache, table, column, query, k=10, distance='l2_distance', id_column='id', where=None, params=()):
+    # searches often share a shape, so only compose each query once
+    key = (table, column, k, distance, id_column, where)
+    try:
+        sql_query = cache[key]
+    except KeyError:
+        sql_query = cache[key] = _neighbors_query(table, column, distance, id_column, where, k, False).as_string(conn)
+    except TypeError:
+        sql_query = _neighbors_query(table, column, distance, id_column, where, k, False)
+    return sql_query, (query, *params)
+
+
+# send all searches in one network flight with pipeline mode
+def pipeline_neighbors(conn, searches):
+    results = []
+    cache = {}
+    with conn.pipeline() as pipeline:
+        cursors = []
+        for search in searches:
+            cur = conn.cursor(binary=True, row_factory=tuple_row)
+            cur.execute(*_search(conn, cache, **search))
+            cursors.append(cur)
+        pipeline.sync()
+
+        for cur in cursors:
+            ids, distances, _ = _batch(cur.fetchall(), False)
+            results.append((ids, distances))
+            cur.close()
+    return results
+
+
+async def pipeline_neighbors_async(conn, searches):
+    results = []
+    cache = {}
+    async with conn.pipeline() as pipeline:
+        cursors = []
+        for search in searches:
+            cur = conn.cursor(binary=True, row_factory=tuple_row)
+            await cur.execute(*_search(conn, cache, **search))
+            cursors.append(cur)
+        await pipeline.sync()
+
+        for cur in cursors:
+            ids, distances, _ = _batch(await cur.fetchall(), False)
+            results.append((ids, distances))
+            await cur.close()
+    return results
+
+
+# run searches concurrently over a pool with at most concurrency in flight
+async def concurrent_neighbors(pool, table, column, queries, k=10, distance='l2_distance', id_column='id', where=None, params=(), type='vector', concurrency=None):
+    queries = to_vectors(queries, type)
+    sql_query = _neighbors_query(table, column, distance, id_column, where, k, False)
+    semaphore = asyncio.Semaphore(concurrency or pool.max_size)
+
+    async def search(query):
+        async with semaphore:
+            async with pool.connection() as conn:
+                start = perf_counter()
+                async with conn.cursor(binary=True, row_factory=tuple_row) as cur:
+                    await cur.execute(sql_query, (query, *params))
+                    rows = await cur.fetchall()
+                return rows, perf_counter() - start
+
+    results = await asyncio.gather(*[search(query) for query in queries])
+    rows = [(i, id, distance) for i, (result, _) in enumerate(results, 1) for id, distance in result]
+    ids, distances = neighbor_arrays(rows, len(queries), k)
+    timings = np.array([elapsed for _, elapsed in results], dtype=np.float64)
+    return ids, distances, timings
+
+
+class _PreparedNeighbors:
+    def __init__(self, conn, table, column, k=10, distance='l2_distance', id_column='id', where=None):
+        self.conn = conn
+        self.name = 'pgvector_prepared_%d' % next(_statement_ids)
+        self.executions = 0
+        self.planning_time = None
+        # the comment identifies the statement in pg_prepared_statements
+        # and %b forces binary dumpers for the query vector
+        self._marker = '/* %s */' % self.name
+        self._query = self._marker + ' ' + _neighbors_query(table, column, distance, id_column, where, k, False, '%b').as_string(conn)
+        self._params = None
+
+    def _stats(self, generic_plans, custom_plans):
+        # generic plans reuse the cached plan instead of planning again
+        return {
+            'executions': self.executions,
+            'generic_plans': generic_plans,
+            'custom_plans': custom_plans,
+            'planning_time': self.planning_time,
+            'planning_time_saved': None if self.planning_time is None else self.planning_time * generic_plans
+        }
+
+
+# prepare a search once per connection and reuse the plan
+# planning time and stats require Postgres 14+
+class PreparedNeighbors(_PreparedNeighbors):
+    def search(self, query, params=()):
+        self._params = (query, *params)
+        with self.conn.cursor(binary=True, row_factory=tuple_row) as cur:
+            # psycopg keeps the prepared handle for the connection
+            cur.execute(self._query, self._params, prepare=True)
+            ids, distances, _ = _batch(cur.fetchall(), False)
+        self.executions += 1
+        return ids, distances
+
+    def stats(self):
+        with self.conn.cursor(row_factory=tuple_row) as cur:
+            if self.planning_time is None and self._params is not None:
+                cur.execute('EXPLAIN (SUMMARY, FORMAT JSON) ' + self._query, self._params)
+                self.planning_time = _planning_time(cur.fetchone()[0])
+            cur.execute(PREPARED_STATS_SQL, (self._marker,))
+            return self._stats(*cur.fetchone())
+
+
+class AsyncPreparedNeighbors(_PreparedNeighbors):
+    async def search(self, query, params=()):
+        self._params = (query, *params)
+        async with self.conn.cursor(binary=True, row_factory=tuple_row) as cur:
+            await cur.execute(self._query, self._params, prepare=True)
+            ids, distances, _ = _batch(await cur.fetchall(), False)
+        self.executions += 1
+        return ids, distances
+
+    async def stats(self):
+        async with self.conn.cursor(row_factory=tuple_row) as cur:
+            if self.planning_time is None and self._params is not None:
+                await cur.execute('EXPLAIN (SUMMARY, FORMAT JSON) ' + self._query, self._params)
+                self.planning_time = _planning_time((await cur.fetchone())[0])
+            await cur.execute(PREPARED_STATS_SQL, (self._marker,))
+            return self._stats(*(await cur.fetchone()))
+
+
+def _planning_time(plan):
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]['Planning Time']
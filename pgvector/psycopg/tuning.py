@@ -0,0 +1,87 @@
+import numpy as np
+from psycopg import Rollback
+from psycopg.rows import tuple_row
+from time import perf_counter
+from ..matrix import to_vectors
+from .search import _identifier, _neighbors_query
+
+INDEX_METHODS_SQL = 'SELECT DISTINCT am.amname FROM pg_index i INNER JOIN pg_class c ON c.oid = i.indexrelid INNER JOIN pg_am am ON am.oid = c.relam INNER JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0] WHERE i.indrelid = to_regclass(%s) AND a.attname = %s'
+
+# default sweeps for each index method
+SWEEPS = {
+    'hnsw': ('hnsw.ef_search', [10, 20, 40, 80, 160, 320]),
+    'ivfflat': ('ivfflat.probes', [1, 2, 4, 8, 16, 32])
+}
+
+# tolerance for distances equal to the k-th exact distance
+EPSILON = 1e-6
+
+
+def _default_settings(conn, table, column, iterative_scan):
+    with conn.cursor(row_factory=tuple_row) as cur:
+        cur.execute(INDEX_METHODS_SQL, (_identifier(table).as_string(conn), column))
+        methods = sorted(row[0] for row in cur.fetchall() if row[0] in SWEEPS)
+
+    if not methods:
+        raise ValueError('no hnsw or ivfflat index on %s; pass settings' % column)
+
+    settings = []
+    for method in methods:
+        name, values = SWEEPS[method]
+        for value in values:
+            setting = {name: value}
+            if iterative_scan is not None:
+                setting[method + '.iterative_scan'] = iterative_scan
+            settings.append(setting)
+    return settings
+
+
+def _run(conn, sql_query, queries, params, settings):
+    distances = []
+    timings = []
+    with conn.transaction() as tx:
+        with conn.cursor(binary=True, row_factory=tuple_row) as cur:
+            for name, value in settings.items():
+                cur.execute('SELECT set_config(%s, %s, true)', (name, str(value)))
+            for query in queries:
+                start = perf_counter()
+                cur.execute(sql_query, (query, *params))
+                rows = cur.fetchall()
+                timings.append(perf_counter() - start)
+                # nulls sort last, like infinite distances
+                distances.append(np.array([np.inf if row[1] is None else row[1] for row in rows], dtype=np.float64))
+        # roll back so settings do not leak into an outer transaction
+        raise Rollback(tx)
+    return distances, np.array(timings)
+
+
+# count results as close as the k-th exact neighbor as hits instead of comparing ids
+# so ties at that distance, like with bit vectors or duplicates, are not misses
+def _recall(distances, exact_distances):
+    return float(np.mean([min(np.count_nonzero(d <= e[-1] + EPSILON), len(e)) / len(e) if len(e) else 1.0 for d, e in zip(distances, exact_distances)]))
+
+
+# compare an index with a sweep of settings to an exact scan
+# latencies are in seconds
+def tune_search(conn, table, column, queries, k=10, distance='l2_distance', id_column='id', where=None, params=(), type='vector', settings=None, iterative_scan=None):
+    queries = to_vectors(queries, type)
+    if settings is None:
+        settings = _default_settings(conn, table, column, iterative_scan)
+
+    sql_query = _neighbors_query(table, column, distance, id_column, where, k, False)
+
+    exact_distances, timings = _run(conn, sql_query, queries, params, {'enable_indexscan': 'off'})
+    results = [{'settings': None, 'recall': 1.0, 'latency': float(np.mean(timings)), 'p99_latency': float(np.percentile(timings, 99))}]
+
+    # warm the index before timing
+    _run(conn, sql_query, queries, params, settings[0])
+
+    for setting in settings:
+        distances, timings = _run(conn, sql_query, queries, params, setting)
+        results.append({
+            'settings': setting,
+            'recall': _recall(distances, exact_distances),
+            'latency': float(np.mean(timings)),
+            'p99_latency': float(np.percentile(timings, 99))
+        })
+    return results
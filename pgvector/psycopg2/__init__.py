@@ -1,10 +1,11 @@
-from .register import register_vector
+from .register import fetch_type_info, register_vector
 
 # TODO remove
 from .. import HalfVector, SparseVector
 
 __all__ = [
     'register_vector',
+    'fetch_type_info',
     'HalfVector',
     'SparseVector'
 ]
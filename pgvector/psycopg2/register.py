@@ -5,15 +5,21 @@ from .sparsevec import register_sparsevec_info
 from .vector import register_vector_info
 
 
-# note: register_adapter is always global
-def register_vector(conn_or_curs, globally=False, arrays=True):
+def fetch_type_info(conn_or_curs):
     conn = conn_or_curs if hasattr(conn_or_curs, 'cursor') else conn_or_curs.connection
     cur = conn.cursor(cursor_factory=cursor)
-    scope = None if globally else conn_or_curs
 
     # use to_regtype to get first matching type in search path
     cur.execute("SELECT typname, oid FROM pg_type WHERE oid IN (to_regtype('vector'), to_regtype('_vector'), to_regtype('halfvec'), to_regtype('_halfvec'), to_regtype('sparsevec'), to_regtype('_sparsevec'))")
-    type_info = dict(cur.fetchall())
+    return dict(cur.fetchall())
+
+
+# note: register_adapter is always global
+def register_vector(conn_or_curs, globally=False, arrays=True, type_info=None):
+    scope = None if globally else conn_or_curs
+
+    if type_info is None:
+        type_info = fetch_type_info(conn_or_curs)
 
     if 'vector' not in type_info:
         raise psycopg2.ProgrammingError('vector type not found in the database')
@@ -91,6 +91,16 @@ class SparseVector:
         self._values = value.data.tolist()
 
     def _from_dense(self, value):
+        if isinstance(value, np.ndarray):
+            if value.ndim != 1:
+                raise ValueError('expected ndim to be 1')
+
+            indices = np.flatnonzero(value)
+            self._dim = len(value)
+            self._indices = indices.tolist()
+            self._values = value[indices].astype(np.float64).tolist()
+            return
+
         self._dim = len(value)
         self._indices = [i for i, v in enumerate(value) if v != 0]
         self._values = [float(value[i]) for i in self._indices]
@@ -1,6 +1,12 @@
 from .bit import BIT
+from .bulk import bulk_insert, bulk_insert_async
 from .functions import avg, sum
 from .halfvec import HALFVEC
+from .hybrid import fused_search, fusion_query, hybrid_search, hybrid_search_query, text_retriever, vector_retriever
+from .index import HnswIndex, IvfflatIndex
+from .matrix import column_matrix, column_matrix_async
+from .register import register_vector
+from .search import batch_neighbors, batch_neighbors_query, cached_neighbors, invalidate_on_commit, knn
 from .sparsevec import SPARSEVEC
 from .vector import VECTOR
 from .vector import VECTOR as Vector
@@ -16,6 +22,24 @@ __all__ = [
     'SPARSEVEC',
     'HalfVector',
     'SparseVector',
+    'HnswIndex',
+    'IvfflatIndex',
     'avg',
-    'sum'
+    'sum',
+    'register_vector',
+    'column_matrix',
+    'column_matrix_async',
+    'bulk_insert',
+    'bulk_insert_async',
+    'batch_neighbors',
+    'batch_neighbors_query',
+    'cached_neighbors',
+    'invalidate_on_commit',
+    'knn',
+    'hybrid_search',
+    'hybrid_search_query',
+    'fused_search',
+    'fusion_query',
+    'vector_retriever',
+    'text_retriever'
 ]
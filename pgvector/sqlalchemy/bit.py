@@ -1,30 +1,96 @@
+import numpy as np
 from sqlalchemy.dialects.postgresql.base import ischema_names
 from sqlalchemy.types import UserDefinedType, Float
+from .. import Bit
+from .register import _binary
+
+OUTPUTS = (None, 'bit', 'packed')
+
+
+def _bit(data, length):
+    bit = Bit.__new__(Bit)
+    bit._len = length
+    bit._data = data
+    return bit
+
+
+def _from_text(value):
+    # compare bytes instead of building a list of characters
+    return _bit(np.packbits(np.frombuffer(value.encode('ascii'), dtype=np.uint8) != ord('0')).tobytes(), len(value))
 
 
 class BIT(UserDefinedType):
     cache_ok = True
 
-    def __init__(self, length=None):
+    # output is None for driver values, 'bit' for Bit objects,
+    # or 'packed' for NumPy arrays of bytes like np.packbits
+    def __init__(self, length=None, output=None):
         super(UserDefinedType, self).__init__()
+        if output not in OUTPUTS:
+            raise ValueError('unknown output: %s' % output)
+        if output == 'packed' and length is None:
+            raise ValueError('packed output requires length')
         self.length = length
+        self.output = output
 
     def get_col_spec(self, **kw):
         if self.length is None:
             return 'BIT'
         return 'BIT(%d)' % self.length
 
+    def _to_bit(self, value):
+        if isinstance(value, Bit):
+            return value
+        if isinstance(value, str):
+            return _from_text(value)
+        if self.output == 'packed' and isinstance(value, np.ndarray):
+            return _bit(np.asarray(value, dtype=np.uint8).tobytes(), self.length)
+        return Bit(value)
+
     def bind_processor(self, dialect):
         if dialect.__class__.__name__ == 'PGDialect_asyncpg':
             import asyncpg
 
             def process(value):
+                if value is None or isinstance(value, asyncpg.BitString):
+                    return value
                 if isinstance(value, str):
                     return asyncpg.BitString(value)
-                return value
+                value = self._to_bit(value)
+                return asyncpg.BitString.frombytes(value._data, value._len)
+            return process
+        elif _binary(dialect):
+            # the registered dumpers send Bit objects in binary format
+            def process(value):
+                if value is None or isinstance(value, str):
+                    return value
+                return self._to_bit(value)
             return process
         else:
-            return super().bind_processor(dialect)
+            def process(value):
+                if value is None or isinstance(value, str):
+                    return value
+                return self._to_bit(value).to_text()
+            return process
+
+    def result_processor(self, dialect, coltype):
+        if self.output is None:
+            return None
+
+        def process(value):
+            if value is None:
+                return value
+
+            if isinstance(value, str):
+                value = _from_text(value)
+            elif not isinstance(value, Bit):
+                # asyncpg BitString
+                value = _bit(value.bytes, len(value))
+
+            if self.output == 'packed':
+                return np.frombuffer(value._data, dtype=np.uint8)
+            return value
+        return process
 
     class comparator_factory(UserDefinedType.Comparator):
         def hamming_distance(self, other):
@@ -0,0 +1,123 @@
+from sqlalchemy import Table, insert, inspect
+from ..binary_copy import ATTRIBUTE_TYPES_SQL, BINARY_ENCODERS, BYTEA_OID, binary_dumpable, copy_sql
+from .bit import BIT
+from .halfvec import HALFVEC
+from .register import _binary
+from .sparsevec import SPARSEVEC
+from .vector import VECTOR
+
+TYPE_NAMES = {
+    VECTOR: 'vector',
+    HALFVEC: 'halfvec',
+    SPARSEVEC: 'sparsevec',
+    BIT: 'bit'
+}
+
+
+def _columns(entity, keys):
+    if isinstance(entity, Table):
+        return entity, [entity.c[key] for key in keys]
+
+    mapper = inspect(entity)
+    columns = [mapper.column_attrs[key].columns[0] for key in keys]
+    for column in columns:
+        if column.table is not mapper.local_table:
+            raise ValueError('column not in %s: %s' % (mapper.local_table.name, column.name))
+    return mapper.local_table, columns
+
+
+def _copy_sql(dialect, table, columns):
+    preparer = dialect.identifier_preparer
+    return copy_sql(preparer.format_table(table), [preparer.format_column(column) for column in columns])
+
+
+def _process(row, keys, processors):
+    return [value if processor is None else processor(value) for value, processor in zip((row[key] for key in keys), processors)]
+
+
+def _copy_types(dialect, columns, oids, adapters):
+    # send pgvector types as their binary representation so the driver
+    # does not need the types registered
+    types = []
+    processors = []
+    for column in columns:
+        type_name = TYPE_NAMES.get(type(column.type))
+        if type_name is None:
+            # Psycopg has no binary dumper for types like enums
+            if not binary_dumpable(adapters, oids[column.name]):
+                return None, None
+            types.append(oids[column.name])
+            processors.append(column.type._cached_bind_processor(dialect))
+        else:
+            types.append(BYTEA_OID)
+            processors.append(BINARY_ENCODERS[type_name])
+    return types, processors
+
+
+# rows are dicts like session.execute(insert(entity), rows)
+# column defaults are not applied with COPY
+def bulk_insert(session, entity, rows, min_copy_rows=1000):
+    rows = list(rows)
+    connection = session.connection()
+    dialect = connection.dialect
+    if len(rows) < max(min_copy_rows, 1) or dialect.driver != 'psycopg':
+        if rows:
+            session.execute(insert(entity), rows)
+        return len(rows)
+
+    keys = list(rows[0])
+    table, columns = _columns(entity, keys)
+    conn = connection.connection.driver_connection
+
+    with conn.cursor() as cur:
+        oids = dict(cur.execute(ATTRIBUTE_TYPES_SQL, (dialect.identifier_preparer.format_table(table),)).fetchall())
+        types, processors = _copy_types(dialect, columns, oids, conn.adapters)
+        if types is None:
+            session.execute(insert(entity), rows)
+            return len(rows)
+
+        with cur.copy(_copy_sql(dialect, table, columns)) as copy:
+            copy.set_types(types)
+            for row in rows:
+                copy.write_row(_process(row, keys, processors))
+
+    return len(rows)
+
+
+# asyncpg needs the types registered with register_vector(engine)
+async def bulk_insert_async(session, entity, rows, min_copy_rows=1000):
+    rows = list(rows)
+    connection = await session.connection()
+    dialect = connection.dialect
+    asyncpg = dialect.driver == 'asyncpg' and _binary(dialect)
+    if len(rows) < max(min_copy_rows, 1) or not (dialect.driver == 'psycopg' or asyncpg):
+        if rows:
+            await session.execute(insert(entity), rows)
+        return len(rows)
+
+    keys = list(rows[0])
+    table, columns = _columns(entity, keys)
+    raw_connection = await connection.get_raw_connection()
+    conn = raw_connection.driver_connection
+
+    if asyncpg:
+        processors = [column.type._cached_bind_processor(dialect) for column in columns]
+        records = [_process(row, keys, processors) for row in rows]
+        # start the transaction so the copy is part of the session
+        await connection.exec_driver_sql('SELECT 1')
+        await conn.copy_records_to_table(table.name, records=records, columns=[column.name for column in columns], schema_name=table.schema)
+        return len(rows)
+
+    async with conn.cursor() as cur:
+        await cur.execute(ATTRIBUTE_TYPES_SQL, (dialect.identifier_preparer.format_table(table),))
+        types, processors = _copy_types(dialect, columns, dict(await cur.fetchall()), conn.adapters)
+        if types is None:
+            await session.execute(insert(entity), rows)
+            return len(rows)
+
+        async with cur.copy(_copy_sql(dialect, table, columns)) as copy:
+            copy.set_types(types)
+            for row in rows:
+                await copy.write_row(_process(row, keys, processors))
+
+    return len(rows)
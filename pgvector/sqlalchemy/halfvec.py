@@ -1,10 +1,13 @@
 from sqlalchemy.dialects.postgresql.base import ischema_names
 from sqlalchemy.types import UserDefinedType, Float, String
 from .. import HalfVector
+from .register import _binary, _binary_bind_processor
 
 
 class HALFVEC(UserDefinedType):
     cache_ok = True
+    # asyncpg needs the type of each parameter in binary format
+    render_bind_cast = True
     _string = String()
 
     def __init__(self, dim=None):
@@ -17,6 +20,9 @@ class HALFVEC(UserDefinedType):
         return 'HALFVEC(%d)' % self.dim
 
     def bind_processor(self, dialect):
+        if _binary(dialect):
+            return _binary_bind_processor(HalfVector, self.dim)
+
         def process(value):
             return HalfVector._to_db(value, self.dim)
         return process
@@ -29,6 +35,10 @@ class HALFVEC(UserDefinedType):
         return process
 
     def result_processor(self, dialect, coltype):
+        # the registered loaders already return objects
+        if _binary(dialect):
+            return None
+
         def process(value):
             return HalfVector._from_db(value)
         return process
@@ -0,0 +1,85 @@
+import numpy as np
+from sqlalchemy import literal, literal_column, select, union_all
+from sqlalchemy.sql import func
+from sqlalchemy.types import Float
+from ..operators import distance_operator
+
+METHODS = ('rrf', 'score')
+
+
+def _regconfig(language):
+    # a constant so expression indexes on to_tsvector can be used
+    return literal_column("'%s'::regconfig" % language.replace("'", "''"))
+
+
+# retrievers are selects of id, rank starting at 1, and score where higher is better
+def vector_retriever(id_column, column, embedding, distance='cosine_distance', where=None, candidates=20):
+    # rank the candidates so the distance is only computed once
+    distance_expr = column.op(distance_operator(distance), return_type=Float)(embedding).label('distance')
+    candidate = select(id_column.label('id'), distance_expr)
+    if where is not None:
+        candidate = candidate.where(where)
+    candidate = candidate.order_by(distance_expr).limit(candidates).subquery('s')
+    return select(candidate.c.id, func.row_number().over(order_by=candidate.c.distance).label('rank'), (-candidate.c.distance).label('score'))
+
+
+def text_retriever(id_column, text_column, query, language='english', where=None, candidates=20):
+    language = _regconfig(language)
+    document = func.to_tsvector(language, text_column)
+    tsquery = func.plainto_tsquery(language, query)
+    score_expr = func.ts_rank_cd(document, tsquery, type_=Float).label('score')
+    candidate = select(id_column.label('id'), score_expr).where(document.bool_op('@@')(tsquery))
+    if where is not None:
+        candidate = candidate.where(where)
+    candidate = candidate.order_by(score_expr.desc()).limit(candidates).subquery('s')
+    return select(candidate.c.id, func.row_number().over(order_by=candidate.c.score.desc()).label('rank'), candidate.c.score)
+
+
+# fuse any number of retrievers in one statement
+# rrf adds weight / (k + rank) and score adds weight * score scaled to [0, 1] for each retriever
+def fusion_query(retrievers, method='rrf', k=60, weights=None, limit=10):
+    if method not in METHODS:
+        raise ValueError('unknown method: %s' % method)
+    if weights is None:
+        weights = [1] * len(retrievers)
+    if len(weights) != len(retrievers):
+        raise ValueError('expected %d weights, not %d' % (len(retrievers), len(weights)))
+
+    parts = []
+    for i, (retriever, weight) in enumerate(zip(retrievers, weights)):
+        r = retriever.subquery('r%d' % i)
+        weight = literal(float(weight))
+        if method == 'rrf':
+            contribution = weight / (literal(int(k)) + r.c.rank)
+        else:
+            low = func.min(r.c.score).over()
+            high = func.max(r.c.score).over()
+            contribution = weight * func.coalesce((r.c.score - low) / func.nullif(high - low, 0), 1.0)
+        parts.append(select(r.c.id, contribution.label('score')))
+
+    fused = union_all(*parts).subquery('f')
+    score = func.sum(fused.c.score).label('score')
+    return select(fused.c.id, score).group_by(fused.c.id).order_by(score.desc(), fused.c.id).limit(limit)
+
+
+def _fused(rows):
+    ids = np.array([row[0] for row in rows])
+    scores = np.array([row[1] for row in rows], dtype=np.float64)
+    return ids, scores
+
+
+def fused_search(session, retrievers, method='rrf', k=60, weights=None, limit=10):
+    return _fused(session.execute(fusion_query(retrievers, method, k, weights, limit)).all())
+
+
+def hybrid_search_query(id_column, column, text_column, embedding, query, limit=10, distance='cosine_distance', where=None, language='english', k=60, weights=(1, 1), candidates=20):
+    retrievers = [
+        vector_retriever(id_column, column, embedding, distance, where, candidates),
+        text_retriever(id_column, text_column, query, language, where, candidates)
+    ]
+    return fusion_query(retrievers, 'rrf', k, weights, limit)
+
+
+# combine vector and full-text search with reciprocal rank fusion in one query
+def hybrid_search(session, id_column, column, text_column, embedding, query, limit=10, distance='cosine_distance', where=None, language='english', k=60, weights=(1, 1), candidates=20):
+    return _fused(session.execute(hybrid_search_query(id_column, column, text_column, embedding, query, limit, distance, where, language, k, weights, candidates)).all())
@@ -0,0 +1,83 @@
+from sqlalchemy import Index, event, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import func
+
+PROGRESS_SQL = text('SELECT phase, blocks_done, blocks_total, tuples_done, tuples_total FROM pg_stat_progress_create_index WHERE relid = to_regclass(:table)')
+
+
+class _VectorIndex(Index):
+    _method = None
+
+    def __init__(self, name, expression, ops='vector_l2_ops', concurrently=False, maintenance_work_mem=None, max_parallel_maintenance_workers=None, with_=None, **kwargs):
+        key = expression if isinstance(expression, str) else expression.key
+        with_ = {k: v for k, v in (with_ or {}).items() if v is not None}
+        super().__init__(
+            name,
+            expression,
+            postgresql_using=self._method,
+            postgresql_with=with_,
+            postgresql_ops={key: ops},
+            postgresql_concurrently=concurrently,
+            **kwargs
+        )
+
+        settings = {
+            'maintenance_work_mem': maintenance_work_mem,
+            'max_parallel_maintenance_workers': max_parallel_maintenance_workers
+        }
+        self.build_settings = {k: str(v) for k, v in settings.items() if v is not None}
+        if self.build_settings:
+            event.listen(self, 'before_create', _apply_build_settings)
+            event.listen(self, 'after_create', _restore_build_settings)
+
+    def create(self, bind, checkfirst=False):
+        try:
+            super().create(bind, checkfirst=checkfirst)
+        except Exception:
+            # after_create is not called when the build fails
+            if isinstance(bind, Connection):
+                _discard_build_settings(self, bind)
+            raise
+
+    # returns None when no build is running for the table
+    def progress(self, bind):
+        table = bind.dialect.identifier_preparer.format_table(self.table)
+        row = bind.execute(PROGRESS_SQL, {'table': table}).first()
+        return None if row is None else dict(row._mapping)
+
+
+class HnswIndex(_VectorIndex):
+    _method = 'hnsw'
+
+    def __init__(self, name, expression, ops='vector_l2_ops', m=None, ef_construction=None, **kwargs):
+        super().__init__(name, expression, ops, with_={'m': m, 'ef_construction': ef_construction}, **kwargs)
+
+
+class IvfflatIndex(_VectorIndex):
+    _method = 'ivfflat'
+
+    def __init__(self, name, expression, ops='vector_l2_ops', lists=None, **kwargs):
+        super().__init__(name, expression, ops, with_={'lists': lists}, **kwargs)
+
+
+# session-level settings since CREATE INDEX CONCURRENTLY cannot run in a transaction
+def _apply_build_settings(index, connection, **kw):
+    previous = {}
+    for name, value in index.build_settings.items():
+        previous[name] = connection.execute(select(func.current_setting(name))).scalar()
+        connection.execute(select(func.set_config(name, value, False)))
+    connection.info[('pgvector_build_settings', index.name)] = previous
+
+
+def _restore_build_settings(index, connection, **kw):
+    previous = connection.info.pop(('pgvector_build_settings', index.name), {})
+    for name, value in previous.items():
+        connection.execute(select(func.set_config(name, value, False)))
+
+
+def _discard_build_settings(index, connection):
+    previous = connection.info.pop(('pgvector_build_settings', index.name), {})
+    # in a transaction, rolling back the failed build restores the settings
+    if previous and getattr(connection.connection.dbapi_connection, 'autocommit', False):
+        for name, value in previous.items():
+            connection.execute(select(func.set_config(name, value, False)))
@@ -0,0 +1,23 @@
+import numpy as np
+from ..matrix import to_matrix
+
+
+def _concatenate(chunks, dtype):
+    if len(chunks) == 0:
+        return np.empty((0, 0), dtype=dtype)
+
+    dim = chunks[0].shape[1]
+    for chunk in chunks:
+        if chunk.shape[1] != dim:
+            raise ValueError('expected %d dimensions, not %d' % (dim, chunk.shape[1]))
+    return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+
+# use with yield_per to convert rows in batches as they are fetched
+# column is a position or key like Result.scalars
+def column_matrix(result, column=0, dtype=np.float32):
+    return _concatenate([to_matrix(values, dtype) for values in result.scalars(column).partitions()], dtype)
+
+
+async def column_matrix_async(result, column=0, dtype=np.float32):
+    return _concatenate([to_matrix(values, dtype) async for values in result.scalars(column).partitions()], dtype)
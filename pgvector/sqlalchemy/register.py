@@ -0,0 +1,54 @@
+from sqlalchemy import event
+
+# drivers that can send and receive vectors in binary
+BINARY_DRIVERS = ('psycopg', 'asyncpg')
+
+
+def register_vector(engine):
+    sync_engine = getattr(engine, 'sync_engine', engine)
+    dialect = sync_engine.dialect
+    driver = dialect.driver
+
+    if driver == 'psycopg':
+        if dialect.is_async:
+            from ..psycopg import register_vector_async
+
+            def register(dbapi_connection):
+                dbapi_connection.run_async(register_vector_async)
+        else:
+            from ..psycopg import register_vector as register
+    elif driver == 'asyncpg':
+        from ..asyncpg import register_vector as register_asyncpg
+
+        def register(dbapi_connection):
+            dbapi_connection.run_async(register_asyncpg)
+    elif driver == 'psycopg2':
+        from ..psycopg2 import register_vector as register
+    else:
+        raise ValueError('unsupported driver: %s' % driver)
+
+    @event.listens_for(sync_engine, 'connect')
+    def connect(dbapi_connection, connection_record):
+        register(dbapi_connection)
+
+    # let types pass objects to the registered binary adapters
+    dialect._pgvector_binary = driver in BINARY_DRIVERS
+
+
+def _binary(dialect):
+    return getattr(dialect, '_pgvector_binary', False)
+
+
+def _binary_bind_processor(cls, dim):
+    def process(value):
+        if value is None:
+            return value
+
+        if not isinstance(value, cls):
+            value = cls(value)
+
+        if dim is not None and value.dimensions() != dim:
+            raise ValueError('expected %d dimensions, not %d' % (dim, value.dimensions()))
+
+        return value
+    return process
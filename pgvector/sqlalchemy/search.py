@@ -0,0 +1,122 @@
+from itertools import chain
+import numpy as np
+from sqlalchemy import bindparam, cast, event, select, true
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import object_mapper
+from sqlalchemy.sql import Select, func
+from sqlalchemy.types import Float
+from ..cache import neighbor_key
+from ..matrix import neighbor_arrays
+from ..operators import distance_operator
+
+
+# get the nearest neighbors with index settings for this query only
+# settings are applied with SET LOCAL in the same transaction, so values
+# do not change the SQL and the compiled statement is cached
+def knn(column, query, k=10, distance='l2_distance', ef_search=None, probes=None, iterative_scan=None):
+    settings = {}
+    if ef_search is not None:
+        settings['hnsw.ef_search'] = ef_search
+    if probes is not None:
+        settings['ivfflat.probes'] = probes
+    if iterative_scan is not None:
+        settings['hnsw.iterative_scan'] = iterative_scan
+        # strict_order is not supported for IVFFlat
+        if iterative_scan != 'strict_order':
+            settings['ivfflat.iterative_scan'] = iterative_scan
+
+    entity = column.class_ if hasattr(column, 'class_') else column.table
+    distance_expr = column.op(distance_operator(distance), return_type=Float)(query)
+    stmt = select(entity).order_by(distance_expr).limit(k)
+    if settings:
+        # copy like generative methods so the statement applies its own settings
+        knn_stmt = _KnnSelect.__new__(_KnnSelect)
+        knn_stmt.__dict__ = stmt.__dict__.copy()
+        stmt = knn_stmt.execution_options(pgvector_settings=tuple((name, str(value)) for name, value in settings.items()))
+    return stmt
+
+
+class _KnnSelect(Select):
+    inherit_cache = True
+
+    def _execute_on_connection(self, connection, *args, **kwargs):
+        _apply_settings(connection, self._execution_options.get('pgvector_settings'))
+        return super()._execute_on_connection(connection, *args, **kwargs)
+
+
+# one statement for all settings
+def _apply_settings(connection, settings):
+    if not settings:
+        return
+
+    # SET LOCAL has no effect outside a transaction
+    if getattr(connection.connection.dbapi_connection, 'autocommit', False):
+        raise ValueError('index settings require a transaction, not autocommit')
+
+    connection.execute(select(*[func.set_config(name, value, True) for name, value in settings]))
+
+
+def batch_neighbors_query(id_column, column, queries, k=10, distance='l2_distance', where=None):
+    array_type = ARRAY(column.type, dimensions=1)
+    queries = bindparam('queries', list(queries), type_=array_type)
+    q = func.unnest(cast(queries, array_type)).table_valued('embedding', with_ordinality='i').render_derived(name='q')
+
+    distance_expr = column.op(distance_operator(distance), return_type=Float)(q.c.embedding).label('distance')
+    neighbors = select(id_column.label('id'), distance_expr)
+    if where is not None:
+        neighbors = neighbors.where(where)
+    neighbors = neighbors.order_by(distance_expr).limit(k).lateral('n')
+
+    return select(q.c.i, neighbors.c.id, neighbors.c.distance).select_from(q).join(neighbors, true()).order_by(q.c.i, neighbors.c.distance)
+
+
+# run one query for all query vectors with a lateral join
+def batch_neighbors(session, id_column, column, queries, k=10, distance='l2_distance', where=None):
+    queries = list(queries)
+    rows = session.execute(batch_neighbors_query(id_column, column, queries, k, distance, where)).all()
+    return neighbor_arrays(rows, len(queries), k)
+
+
+# reuse results for repeated searches
+# use invalidate_on_commit or call cache.invalidate(table) after the table changes
+def cached_neighbors(session, cache, id_column, column, query, k=10, distance='l2_distance', where=None):
+    column = column.expression
+    id_column = id_column.expression
+    where_sql = None
+    params = ()
+    if where is not None:
+        compiled = where.compile(dialect=session.get_bind().dialect)
+        where_sql = str(compiled)
+        params = [value for item in sorted(compiled.params.items(), key=lambda item: item[0]) for value in item]
+
+    table = column.table.fullname
+    key = neighbor_key(query, str(column), k, distance, where_sql, params, str(id_column))
+    result = cache.get(table, key)
+    if result is None:
+        distance_expr = column.op(distance_operator(distance), return_type=Float)(query)
+        stmt = select(id_column, distance_expr)
+        if where is not None:
+            stmt = stmt.where(where)
+        rows = session.execute(stmt.order_by(distance_expr).limit(k)).all()
+        ids = np.array([row[0] for row in rows])
+        distances = np.array([row[1] for row in rows], dtype=np.float64)
+        result = cache.set(table, key, (ids, distances))
+    return result
+
+
+# invalidate cached results for tables changed by a session when it commits or rolls back
+# session can be a Session, sessionmaker, or Session class
+def invalidate_on_commit(session, cache):
+    def after_flush(session, flush_context):
+        tables = session.info.setdefault('pgvector_invalidate', set())
+        for obj in chain(session.new, session.dirty, session.deleted):
+            tables.update(table.fullname for table in object_mapper(obj).tables)
+
+    # results cached after a flush can include changes that are rolled back
+    def after_end(session):
+        for table in session.info.pop('pgvector_invalidate', ()):
+            cache.invalidate(table)
+
+    event.listen(session, 'after_flush', after_flush)
+    event.listen(session, 'after_commit', after_end)
+    event.listen(session, 'after_rollback', after_end)
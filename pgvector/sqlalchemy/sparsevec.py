@@ -1,10 +1,13 @@
 from sqlalchemy.dialects.postgresql.base import ischema_names
 from sqlalchemy.types import UserDefinedType, Float, String
 from .. import SparseVector
+from .register import _binary, _binary_bind_processor
 
 
 class SPARSEVEC(UserDefinedType):
     cache_ok = True
+    # asyncpg needs the type of each parameter in binary format
+    render_bind_cast = True
     _string = String()
 
     def __init__(self, dim=None):
@@ -17,6 +20,9 @@ class SPARSEVEC(UserDefinedType):
         return 'SPARSEVEC(%d)' % self.dim
 
     def bind_processor(self, dialect):
+        if _binary(dialect):
+            return _binary_bind_processor(SparseVector, self.dim)
+
         def process(value):
             return SparseVector._to_db(value, self.dim)
         return process
@@ -29,6 +35,10 @@ class SPARSEVEC(UserDefinedType):
         return process
 
     def result_processor(self, dialect, coltype):
+        # the registered loaders already return objects
+        if _binary(dialect):
+            return None
+
         def process(value):
             return SparseVector._from_db(value)
         return process
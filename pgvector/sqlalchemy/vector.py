@@ -1,10 +1,13 @@
 from sqlalchemy.dialects.postgresql.base import ischema_names
 from sqlalchemy.types import UserDefinedType, Float, String
 from .. import Vector
+from .register import _binary, _binary_bind_processor
 
 
 class VECTOR(UserDefinedType):
     cache_ok = True
+    # asyncpg needs the type of each parameter in binary format
+    render_bind_cast = True
     _string = String()
 
     def __init__(self, dim=None):
@@ -17,6 +20,9 @@ class VECTOR(UserDefinedType):
         return 'VECTOR(%d)' % self.dim
 
     def bind_processor(self, dialect):
+        if _binary(dialect):
+            return _binary_bind_processor(Vector, self.dim)
+
         def process(value):
             return Vector._to_db(value, self.dim)
         return process
@@ -29,6 +35,10 @@ class VECTOR(UserDefinedType):
         return process
 
     def result_processor(self, dialect, coltype):
+        # the registered loaders already return objects
+        if _binary(dialect):
+            return None
+
         def process(value):
             return Vector._from_db(value)
         return process
@@ -80,4 +80,6 @@ class Vector:
         if value is None or isinstance(value, np.ndarray):
             return value
 
-        return cls.from_binary(value).to_numpy().astype(np.float32)
+        # decode to native byte order without an intermediate Vector
+        dim, unused = unpack_from('>HH', value)
+        return np.frombuffer(value, dtype='>f4', count=dim, offset=4).astype(np.float32)
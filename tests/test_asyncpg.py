@@ -1,7 +1,7 @@
 import asyncpg
 import numpy as np
 from pgvector import HalfVector, SparseVector, Vector
-from pgvector.asyncpg import register_vector
+from pgvector.asyncpg import PreparedNeighbors, batch_neighbors, column_matrix, concurrent_neighbors, fetch_type_info, init_vector, register_vector
 import pytest
 
 
@@ -144,3 +144,156 @@ class TestAsyncpg:
             assert res[0]['embedding'].dtype == np.float32
             assert np.array_equal(res[1]['embedding'], embedding2)
             assert res[2]['embedding'] is None
+
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_pool_init_vector(self):
+        pool = await asyncpg.create_pool(database='pgvector_python_test', min_size=2, init=init_vector())
+
+        for _ in range(2):
+            async with pool.acquire() as conn:
+                res = await conn.fetchrow("SELECT '[1,2,3]'::vector, '[1,2,3]'::halfvec, '{1:1}/3'::sparsevec")
+                assert np.array_equal(res[0], [1, 2, 3])
+                assert res[1] == HalfVector([1, 2, 3])
+                assert res[2] == SparseVector({0: 1}, 3)
+
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_type_info(self):
+        conn = await asyncpg.connect(database='pgvector_python_test')
+        type_info = await fetch_type_info(conn)
+        assert sorted(type_info.keys()) == ['halfvec', 'sparsevec', 'vector']
+
+        new_conn = await asyncpg.connect(database='pgvector_python_test')
+        await register_vector(new_conn, type_info=type_info)
+        res = await new_conn.fetchval("SELECT '[1,2,3]'::vector")
+        assert np.array_equal(res, [1, 2, 3])
+
+        await conn.close()
+        await new_conn.close()
+
+    @pytest.mark.asyncio
+    async def test_set_type_codec_fallback(self):
+        conn = await asyncpg.connect(database='pgvector_python_test')
+        type_info = await fetch_type_info(conn)
+
+        # only has the public API
+        class PublicConnection:
+            async def set_type_codec(self, *args, **kwargs):
+                await conn.set_type_codec(*args, **kwargs)
+
+        await register_vector(PublicConnection(), type_info=type_info)
+        res = await conn.fetchval("SELECT '[1,2,3]'::vector")
+        assert np.array_equal(res, [1, 2, 3])
+
+        await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_unknown_schema(self):
+        conn = await asyncpg.connect(database='pgvector_python_test')
+        with pytest.raises(ValueError, match='unknown type: other.vector'):
+            await register_vector(conn, schema='other')
+        await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_halfvec_numpy(self):
+        conn = await asyncpg.connect(database='pgvector_python_test')
+        await register_vector(conn, halfvec_numpy=True)
+
+        res = await conn.fetchval('SELECT $1::halfvec', np.array([1.5, 2, 3], dtype=np.float16))
+        assert np.array_equal(res, [1.5, 2, 3])
+        assert res.dtype == np.float16
+
+        await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_column_matrix(self):
+        conn = await asyncpg.connect(database='pgvector_python_test')
+        await register_vector(conn)
+
+        res = await conn.fetch("SELECT i AS id, ARRAY[i, i + 1, i + 2]::vector AS embedding FROM generate_series(1, 3) i")
+        matrix = column_matrix(res, 'embedding')
+        assert matrix.shape == (3, 3)
+        assert matrix.dtype == np.float32
+        assert np.array_equal(matrix[1], [2, 3, 4])
+
+        res = await conn.fetch("SELECT '[1,2,3]'::halfvec AS embedding")
+        assert np.array_equal(column_matrix(res, 'embedding'), [[1, 2, 3]])
+
+        assert column_matrix([], 'embedding').shape == (0, 0)
+
+        res = await conn.fetch("SELECT '[1,2,3]'::vector UNION ALL SELECT NULL")
+        with pytest.raises(ValueError, match='expected non-null values'):
+            column_matrix(res, 0)
+
+        await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_neighbors(self):
+        conn = await asyncpg.connect(database='pgvector_python_test')
+        await conn.execute('DROP TABLE IF EXISTS asyncpg_items')
+        await conn.execute('CREATE TABLE asyncpg_items (id bigserial PRIMARY KEY, embedding vector(3), half_embedding halfvec(3))')
+
+        await register_vector(conn)
+
+        for i in range(1, 6):
+            await conn.execute('INSERT INTO asyncpg_items (embedding, half_embedding) VALUES ($1, $2)', np.array([i, i, i]), HalfVector([i, i, i]))
+
+        ids, distances = await batch_neighbors(conn, 'asyncpg_items', 'embedding', np.array([[1, 1, 1], [5, 5, 5]]), k=2)
+        assert ids.tolist() == [[1, 2], [5, 4]]
+        assert distances[:, 0].tolist() == [0, 0]
+
+        ids, distances = await batch_neighbors(conn, 'asyncpg_items', 'half_embedding', [[1, 1, 1]], k=6, distance='l1_distance', where='id <> $2', params=(1,), type='halfvec')
+        assert ids.tolist() == [[2, 3, 4, 5, -1, -1]]
+        assert distances.tolist() == [[3, 6, 9, 12, np.inf, np.inf]]
+
+        await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_neighbors(self):
+        pool = await asyncpg.create_pool(database='pgvector_python_test', min_size=2, max_size=2, init=init_vector())
+
+        async with pool.acquire() as conn:
+            await conn.execute('DROP TABLE IF EXISTS asyncpg_concurrent_items')
+            await conn.execute('CREATE TABLE asyncpg_concurrent_items (id bigserial PRIMARY KEY, embedding vector(3))')
+            for i in range(1, 6):
+                await conn.execute('INSERT INTO asyncpg_concurrent_items (embedding) VALUES ($1)', np.array([i, i, i]))
+
+        queries = np.array([[i, i, i] for i in [1, 5, 5, 1]])
+        ids, distances, timings = await concurrent_neighbors(pool, 'asyncpg_concurrent_items', 'embedding', queries, k=2)
+        assert ids.tolist() == [[1, 2], [5, 4], [5, 4], [1, 2]]
+        assert distances[:, 0].tolist() == [0, 0, 0, 0]
+        assert timings.shape == (4,)
+        assert (timings > 0).all()
+
+        ids, _, _ = await concurrent_neighbors(pool, 'asyncpg_concurrent_items', 'embedding', [[1, 1, 1]], k=6, where='id <> $2', params=(1,), concurrency=1)
+        assert ids.tolist() == [[2, 3, 4, 5, -1, -1]]
+
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_prepared_neighbors(self):
+        conn = await asyncpg.connect(database='pgvector_python_test')
+        await conn.execute('DROP TABLE IF EXISTS asyncpg_prepared_items')
+        await conn.execute('CREATE TABLE asyncpg_prepared_items (id bigserial PRIMARY KEY, embedding vector(3))')
+
+        await register_vector(conn)
+
+        for i in range(1, 6):
+            await conn.execute('INSERT INTO asyncpg_prepared_items (embedding) VALUES ($1)', np.array([i, i, i]))
+
+        search = PreparedNeighbors(conn, 'asyncpg_prepared_items', 'embedding', k=2, where='id <> $2')
+        for _ in range(10):
+            ids, distances = await search.search(np.array([1, 1, 1]), params=(2,))
+            assert ids.tolist() == [1, 3]
+            assert distances.tolist()[0] == 0
+
+        stats = await search.stats()
+        assert stats['executions'] == 10
+        assert stats['generic_plans'] + stats['custom_plans'] == 10
+        assert stats['planning_time'] > 0
+        assert stats['planning_time_saved'] == stats['planning_time'] * stats['generic_plans']
+
+        await conn.close()
@@ -0,0 +1,68 @@
+import numpy as np
+from pgvector import HalfVector, Vector
+from pgvector.cache import NeighborCache, neighbor_key
+import time
+
+
+def result(*ids):
+    return np.array(ids), np.zeros(len(ids))
+
+
+class TestCache:
+    def test_get_set(self):
+        cache = NeighborCache()
+        key = neighbor_key([1, 2, 3], 'embedding', 5, 'l2_distance')
+        assert cache.get('items', key) is None
+        cache.set('items', key, result(1, 2))
+        assert cache.get('items', key)[0].tolist() == [1, 2]
+        assert cache.info() == {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 1024}
+
+    def test_read_only(self):
+        cache = NeighborCache()
+        ids, _ = cache.set('items', b'key', result(1, 2))
+        assert not ids.flags.writeable
+
+    def test_key(self):
+        key = neighbor_key([1, 2, 3], 'embedding', 5, 'l2_distance')
+        assert neighbor_key(np.array([1, 2, 3]), 'embedding', 5, '<->') == key
+        assert neighbor_key(Vector([1, 2, 3]), 'embedding', 5, 'l2_distance') == key
+        assert neighbor_key([1, 2, 4], 'embedding', 5, 'l2_distance') != key
+        assert neighbor_key([1, 2, 3], 'embedding', 6, 'l2_distance') != key
+        assert neighbor_key([1, 2, 3], 'embedding', 5, 'cosine_distance') != key
+        assert neighbor_key([1, 2, 3], 'embedding', 5, 'l2_distance', 'category_id = %s', (1,)) != neighbor_key([1, 2, 3], 'embedding', 5, 'l2_distance', 'category_id = %s', (2,))
+        assert neighbor_key(HalfVector([1, 2, 3]), 'embedding', 5, 'l2_distance') != key
+
+    def test_key_large_params(self):
+        a = np.zeros(2000)
+        b = a.copy()
+        b[1000] = 1
+        assert neighbor_key([1, 2, 3], 'embedding', 5, 'l2_distance', 'x', (a,)) != neighbor_key([1, 2, 3], 'embedding', 5, 'l2_distance', 'x', (b,))
+
+    def test_lru(self):
+        cache = NeighborCache(maxsize=2)
+        cache.set('items', b'a', result(1))
+        cache.set('items', b'b', result(2))
+        cache.get('items', b'a')
+        cache.set('items', b'c', result(3))
+        assert cache.get('items', b'b') is None
+        assert cache.get('items', b'a') is not None
+        assert len(cache) == 2
+        assert cache.info()['evictions'] == 1
+
+    def test_ttl(self):
+        cache = NeighborCache(ttl=0.01)
+        cache.set('items', b'a', result(1))
+        assert cache.get('items', b'a') is not None
+        time.sleep(0.02)
+        assert cache.get('items', b'a') is None
+        assert len(cache) == 0
+
+    def test_invalidate(self):
+        cache = NeighborCache()
+        cache.set('items', b'a', result(1))
+        cache.set('other_items', b'a', result(2))
+        cache.invalidate('items')
+        assert cache.get('items', b'a') is None
+        assert cache.get('other_items', b'a') is not None
+        cache.invalidate()
+        assert len(cache) == 0
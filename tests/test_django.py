@@ -2,6 +2,7 @@ import django
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core import serializers
 from django.db import connection, migrations, models
 from django.db.models import Avg, Sum, FloatField, DecimalField
@@ -12,8 +13,9 @@ from math import sqrt
 import numpy as np
 import os
 import pgvector.django
+import pytest
 from pgvector import HalfVector, SparseVector
-from pgvector.django import VectorExtension, VectorField, HalfVectorField, BitField, SparseVectorField, IvfflatIndex, HnswIndex, L2Distance, MaxInnerProduct, CosineDistance, L1Distance, HammingDistance, JaccardDistance
+from pgvector.django import VectorExtension, VectorField, HalfVectorField, BitField, SparseVectorField, IvfflatIndex, HnswIndex, L2Distance, MaxInnerProduct, CosineDistance, L1Distance, HammingDistance, JaccardDistance, VectorManager
 from unittest import mock
 
 settings.configure(
@@ -59,6 +61,8 @@ class Item(models.Model):
     double_embedding = ArrayField(FloatField(), null=True, blank=True)
     numeric_embedding = ArrayField(DecimalField(max_digits=20, decimal_places=10), null=True, blank=True)
 
+    objects = VectorManager()
+
     class Meta:
         app_label = 'django_app'
         indexes = [
@@ -117,6 +121,24 @@ class Migration(migrations.Migration):
     ]
 
 
+class Author(models.Model):
+    name = models.TextField()
+
+    class Meta:
+        app_label = 'django_app'
+
+
+class Document(models.Model):
+    author = models.ForeignKey(Author, on_delete=models.CASCADE)
+    embedding = VectorField(dimensions=3)
+    search = SearchVectorField(null=True)
+
+    objects = VectorManager()
+
+    class Meta:
+        app_label = 'django_app'
+
+
 # probably a better way to do this
 migration = Migration('initial', 'django_app')
 loader = MigrationLoader(connection, replace_migrations=False)
@@ -126,6 +148,11 @@ sql_statements = loader.collect_sql([(migration, False)])
 with connection.cursor() as cursor:
     cursor.execute("DROP TABLE IF EXISTS django_app_item")
     cursor.execute('\n'.join(sql_statements))
+    cursor.execute("DROP TABLE IF EXISTS django_app_document, django_app_author")
+
+with connection.schema_editor() as schema_editor:
+    schema_editor.create_model(Author)
+    schema_editor.create_model(Document)
 
 
 def create_items():
@@ -494,3 +521,83 @@ class TestDjango:
         items = Item.objects.annotate(distance=distance).order_by(distance)
         assert [v.id for v in items] == [1, 3, 2]
         assert [v.distance for v in items] == [0, 1, sqrt(3)]
+
+    def test_bulk_copy(self):
+        items = [
+            Item(id=1, embedding=[1, 1, 1], half_embedding=[1, 1, 1], binary_embedding='000', sparse_embedding=SparseVector([1, 1, 1]), double_embedding=[1, 1, 1]),
+            Item(id=2, embedding=np.array([2, 2, 2]), half_embedding=HalfVector([2, 2, 2]), binary_embedding='101', sparse_embedding=SparseVector([2, 0, 2])),
+            Item(id=3)
+        ]
+        assert Item.objects.bulk_copy(items, min_copy_rows=1) == 3
+        items = Item.objects.order_by('id')
+        assert np.array_equal(items[0].embedding, [1, 1, 1])
+        assert items[0].half_embedding.to_list() == [1, 1, 1]
+        assert items[0].binary_embedding == '000'
+        assert items[0].sparse_embedding.to_list() == [1, 1, 1]
+        assert items[0].double_embedding == [1, 1, 1]
+        assert np.array_equal(items[1].embedding, [2, 2, 2])
+        assert items[1].binary_embedding == '101'
+        assert items[1].sparse_embedding.to_list() == [2, 0, 2]
+        assert items[2].embedding is None
+        assert items[2].double_embedding is None
+
+    def test_bulk_copy_generated_keys(self):
+        items = [Item(embedding=[1, 2, 3]), Item(embedding=[4, 5, 6])]
+        Item.objects.bulk_copy(items, min_copy_rows=1)
+        # primary keys are not set
+        assert items[0].pk is None
+        assert [np.array_equal(v.embedding, e) for v, e in zip(Item.objects.order_by('id'), [[1, 2, 3], [4, 5, 6]])] == [True, True]
+
+        with pytest.raises(ValueError, match='expected all or no primary keys'):
+            Item.objects.bulk_copy([Item(id=10), Item()], min_copy_rows=1)
+
+    def test_bulk_copy_arrays(self):
+        embeddings = np.array([[1, 1, 1], [2, 2, 2], [1, 1, 2]], dtype=np.float32)
+        count = Item.objects.bulk_copy({'id': np.arange(1, 4), 'embedding': embeddings, 'half_embedding': embeddings, 'binary_embedding': ['000', '101', '111']}, min_copy_rows=1)
+        assert count == 3
+        items = Item.objects.order_by('id')
+        assert [v.id for v in items] == [1, 2, 3]
+        assert np.array_equal(items[2].embedding, [1, 1, 2])
+        assert items[2].half_embedding.to_list() == [1, 1, 2]
+        assert items[1].binary_embedding == '101'
+
+        distance = L2Distance('embedding', [1, 1, 1])
+        assert [v.id for v in Item.objects.order_by(distance)] == [1, 3, 2]
+
+        with pytest.raises(ValueError, match='expected 2 values, not 1'):
+            Item.objects.bulk_copy({'id': [4, 5], 'embedding': embeddings[:1]})
+
+    def test_bulk_copy_bulk_create(self):
+        # below min_copy_rows
+        items = [Item(embedding=[1, 2, 3])]
+        Item.objects.bulk_copy(items)
+        assert items[0].pk is not None
+
+        # arrays of vectors
+        items = [Item(embeddings=[np.array([1, 2, 3])]) for _ in range(2)]
+        Item.objects.bulk_copy(items, min_copy_rows=1)
+        assert items[0].pk is not None
+        assert Item.objects.count() == 3
+
+        Item.objects.bulk_copy({'id': np.array([10]), 'embedding': np.array([[1, 2, 3]])})
+        assert np.array_equal(Item.objects.get(pk=10).embedding, [1, 2, 3])
+
+    def test_bulk_copy_foreign_key(self):
+        Document.objects.all().delete()
+        authors = [Author.objects.create(name='a'), Author.objects.create(name='b')]
+        embeddings = np.array([[1, 1, 1], [2, 2, 2]])
+
+        # same behavior with bulk_create and COPY
+        for min_copy_rows in [1000, 1]:
+            Document.objects.bulk_copy({'author_id': [authors[0].id, authors[1].id], 'embedding': embeddings}, min_copy_rows=min_copy_rows)
+            Document.objects.bulk_copy({'author': authors, 'embedding': embeddings}, min_copy_rows=min_copy_rows)
+            Document.objects.bulk_copy([Document(author=author, embedding=[3, 3, 3]) for author in authors], min_copy_rows=min_copy_rows)
+
+        assert Document.objects.filter(author=authors[0]).count() == 6
+        assert Document.objects.filter(author=authors[1]).count() == 6
+
+    def test_bulk_copy_search_vector(self):
+        Document.objects.all().delete()
+        author = Author.objects.create(name='a')
+        Document.objects.bulk_copy({'author': [author, author], 'embedding': np.array([[1, 1, 1], [2, 2, 2]]), 'search': ['bear:1', 'cat:1']}, min_copy_rows=1)
+        assert Document.objects.filter(search='bear').count() == 1
@@ -0,0 +1,78 @@
+import numpy as np
+from pgvector import Bit, HalfVector, SparseVector, Vector
+from pgvector.exact import exact_distances, exact_neighbors
+import pytest
+
+
+class TestExact:
+    def test_l2_distance(self):
+        data = np.array([[1, 1, 1], [2, 2, 2], [1, 1, 2]])
+        assert exact_distances(data, [[1, 1, 1]]).tolist() == [[0, np.sqrt(3), 1]]
+
+    def test_max_inner_product(self):
+        data = np.array([[1, 1, 1], [2, 2, 2], [1, 1, 2]])
+        assert exact_distances(data, [[1, 1, 1]], 'max_inner_product').tolist() == [[-3, -6, -4]]
+
+    def test_cosine_distance(self):
+        data = np.array([[1, 1], [-1, -1], [0, 0]])
+        distances = exact_distances(data, [[1, 1]], '<=>')
+        assert distances[0, :2].tolist() == [0, 2]
+        # zero vectors give NaN like Postgres
+        assert np.isnan(distances[0, 2])
+
+    def test_l1_distance(self):
+        data = np.array([[1, 1, 1], [2, 2, 2], [1, 1, 2]])
+        assert exact_distances(data, [[1, 1, 1]], 'l1_distance').tolist() == [[0, 3, 1]]
+
+    def test_hamming_distance(self):
+        data = [Bit('000'), Bit('101'), Bit('111')]
+        assert exact_distances(data, [Bit('101')], 'hamming_distance').tolist() == [[2, 0, 1]]
+
+    def test_jaccard_distance(self):
+        data = np.array([[False, False, False], [True, False, True], [True, True, True]])
+        distances = exact_distances(data, np.array([[True, False, False], [False, False, False]]), 'jaccard_distance')
+        assert distances.tolist() == [[1, 0.5, 1 - 1 / 3], [1, 1, 1]]
+
+    def test_types(self):
+        assert exact_distances([Vector([1, 2]), Vector([3, 4])], [Vector([1, 2])]).tolist() == [[0, np.sqrt(8)]]
+        assert exact_distances([HalfVector([1.5, 2])], [HalfVector([1, 2])], 'l1_distance').tolist() == [[0.5]]
+        assert exact_distances([SparseVector({0: 1}, 3)], [SparseVector({2: 1}, 3)], 'l1_distance').tolist() == [[2]]
+
+    def test_different_dimensions(self):
+        with pytest.raises(ValueError, match='different dimensions 2 and 3'):
+            exact_distances([[1, 1, 1]], [[1, 1]])
+
+    def test_unknown_distance(self):
+        with pytest.raises(ValueError, match='unknown distance: bad'):
+            exact_distances([[1, 1, 1]], [[1, 1, 1]], 'bad')
+
+    def test_neighbors(self):
+        data = np.array([[i, i, i] for i in range(1, 6)])
+        ids, distances = exact_neighbors(data, np.array([[1, 1, 1], [5, 5, 5]]), k=2)
+        assert ids.tolist() == [[0, 1], [4, 3]]
+        assert distances[:, 0].tolist() == [0, 0]
+
+    def test_neighbors_ids(self):
+        data = np.array([[i, i, i] for i in range(1, 6)])
+        ids, _ = exact_neighbors(data, [[5, 5, 5]], k=2, ids=[10, 20, 30, 40, 50])
+        assert ids.tolist() == [[50, 40]]
+
+        ids, _ = exact_neighbors(data, [[5, 5, 5]], k=2, ids=['a', 'b', 'c', 'd', 'e'])
+        assert ids.tolist() == [['e', 'd']]
+
+    def test_neighbors_padding(self):
+        ids, distances = exact_neighbors([[1, 1], [2, 2]], [[1, 1]], k=3, distance='l1_distance')
+        assert ids.tolist() == [[0, 1, -1]]
+        assert distances.tolist() == [[0, 2, np.inf]]
+
+    def test_neighbors_nan_last(self):
+        ids, _ = exact_neighbors([[0, 0], [1, 1], [-1, -1]], [[1, 1]], k=3, distance='cosine_distance')
+        assert ids.tolist() == [[1, 2, 0]]
+
+    def test_neighbors_chunk_size(self):
+        rng = np.random.default_rng(1)
+        data = rng.random((100, 8))
+        queries = rng.random((10, 8))
+        expected = np.argsort(exact_distances(data, queries), axis=1, kind='stable')[:, :5]
+        ids, _ = exact_neighbors(data, queries, k=5, chunk_size=3)
+        assert np.array_equal(ids, expected)
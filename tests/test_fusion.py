@@ -0,0 +1,66 @@
+import numpy as np
+from pgvector.exact import exact_neighbors
+from pgvector.fusion import fuse
+import pytest
+
+
+class TestFusion:
+    def test_rrf(self):
+        ids, scores = fuse([[1, 4, 3, 2], [3]])
+        assert ids.tolist() == [3, 1, 4, 2]
+        assert np.allclose(scores, [1 / 63 + 1 / 61, 1 / 61, 1 / 62, 1 / 64])
+
+    def test_weights(self):
+        ids, scores = fuse([[1, 4, 3, 2], [3]], weights=(1, 0), limit=2)
+        assert ids.tolist() == [1, 4]
+        assert np.allclose(scores, [1 / 61, 1 / 62])
+
+    def test_k(self):
+        ids, scores = fuse([[3, 4], [3]], k=1)
+        assert ids.tolist() == [3, 4]
+        assert np.allclose(scores, [1, 1 / 3])
+
+    def test_ties(self):
+        ids, _ = fuse([[2, 1], [1, 2]])
+        assert ids.tolist() == [1, 2]
+
+    def test_score(self):
+        ids, scores = fuse([[1, 2, 3], [3, 4]], [[-0.1, -0.5, -0.9], [2, 2]], method='score')
+        assert ids.tolist() == [1, 3, 4, 2]
+        assert np.allclose(scores, [1, 1, 1, 0.5])
+
+    def test_strings(self):
+        ids, _ = fuse([np.array(['b', 'a', None], dtype=object), ['a']])
+        assert ids.tolist() == ['a', 'b']
+
+    def test_padding(self):
+        neighbor_ids, distances = exact_neighbors(np.array([[1, 1], [2, 2]]), [[1, 1]], k=3)
+        assert neighbor_ids[0].tolist() == [0, 1, -1]
+
+        ids, _ = fuse([neighbor_ids[0], [5, 6]])
+        assert ids.tolist() == [0, 5, 1, 6]
+
+        ids, scores = fuse([neighbor_ids[0], [5]], [-distances[0], [1]], method='score')
+        assert ids.tolist() == [0, 5, 1]
+        assert scores.tolist() == [1, 1, 0]
+
+    def test_empty(self):
+        ids, scores = fuse([[], []])
+        assert len(ids) == 0
+        assert len(scores) == 0
+
+    def test_score_requires_scores(self):
+        with pytest.raises(ValueError, match='score method requires scores'):
+            fuse([[1]], method='score')
+
+    def test_scores_length(self):
+        with pytest.raises(ValueError, match='expected 2 scores, not 1'):
+            fuse([[1, 2]], [[1]], method='score')
+
+    def test_weights_length(self):
+        with pytest.raises(ValueError, match='expected 2 weights, not 1'):
+            fuse([[1], [2]], weights=(1,))
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError, match='unknown method: other'):
+            fuse([[1]], method='other')
@@ -46,6 +46,13 @@ class TestHalfVector:
     def test_dimensions(self):
         assert HalfVector([1, 2, 3]).dimensions() == 3
 
+    def test_to_text(self):
+        assert HalfVector([1.5, -2, 0.1]).to_text() == '[1.5,-2.0,0.0999755859375]'
+
+        # every half-precision value
+        arr = np.arange(65536, dtype=np.uint16).view(np.float16)
+        assert HalfVector(arr).to_text() == '[' + ','.join([str(float(v)) for v in arr]) + ']'
+
     def test_from_text(self):
         vec = HalfVector.from_text('[1.5,2,3]')
         assert vec.to_list() == [1.5, 2, 3]
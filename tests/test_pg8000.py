@@ -1,7 +1,7 @@
 from getpass import getuser
 import numpy as np
 from pgvector import HalfVector, SparseVector, Vector
-from pgvector.pg8000 import register_vector
+from pgvector.pg8000 import fetch_type_info, register_vector
 from pg8000.native import Connection
 
 conn = Connection(getuser(), database='pgvector_python_test')
@@ -58,3 +58,12 @@ class TestPg8000:
         res = conn.run('SELECT sparse_embedding FROM pg8000_items ORDER BY id')
         assert res[0][0] == embedding
         assert res[1][0] is None
+
+    def test_fetch_type_info(self):
+        type_info = fetch_type_info(conn)
+
+        new_conn = Connection(getuser(), database='pgvector_python_test')
+        register_vector(new_conn, type_info)
+        res = new_conn.run("SELECT '[1,2,3]'::vector")
+        assert np.array_equal(res[0][0], [1, 2, 3])
+        new_conn.close()
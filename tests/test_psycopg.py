@@ -1,6 +1,8 @@
 import numpy as np
 from pgvector import Bit, HalfVector, SparseVector, Vector
-from pgvector.psycopg import register_vector, register_vector_async
+from pgvector.cache import NeighborCache
+from pgvector.psycopg import AsyncPreparedNeighbors, EmbeddingCache, PreparedNeighbors, configure_vector, configure_vector_async, fetch_type_info, fetch_type_info_async, register_vector, register_vector_async, batch_neighbors, batch_neighbors_async, cached_neighbors, concurrent_neighbors, pipeline_neighbors, pipeline_neighbors_async, stream_neighbors, stream_neighbors_async, tune_search
+from pgvector.psycopg import fused_search, fusion_query, hybrid_search, text_retriever, vector_retriever
 import psycopg
 from psycopg_pool import ConnectionPool, AsyncConnectionPool
 import pytest
@@ -186,6 +188,242 @@ class TestPsycopg:
 
         pool.close()
 
+    def test_pool_configure_vector(self):
+        pool = ConnectionPool(conninfo='postgres://localhost/pgvector_python_test', min_size=2, open=True, configure=configure_vector())
+
+        for _ in range(2):
+            with pool.connection() as conn:
+                res = conn.execute("SELECT '[1,2,3]'::vector, '[1,2,3]'::halfvec").fetchone()
+                assert np.array_equal(res[0], [1, 2, 3])
+                assert res[1] == HalfVector([1, 2, 3])
+
+        pool.close()
+
+    def test_fetch_type_info(self):
+        type_info = fetch_type_info(conn)
+        assert sorted(type_info.keys()) == ['bit', 'halfvec', 'sparsevec', 'vector']
+        assert type_info['vector'].array_oid > 0
+
+        new_conn = psycopg.connect(dbname='pgvector_python_test')
+        register_vector(new_conn, type_info)
+        res = new_conn.execute("SELECT '[1,2,3]'::vector").fetchone()
+        assert np.array_equal(res[0], [1, 2, 3])
+        new_conn.close()
+
+    def test_fetch_type_info_transaction(self):
+        new_conn = psycopg.connect(dbname='pgvector_python_test')
+        register_vector(new_conn)
+        assert new_conn.info.transaction_status == psycopg.pq.TransactionStatus.IDLE
+        new_conn.close()
+
+    def test_fetch_type_info_sql_ascii(self):
+        new_conn = psycopg.connect(dbname='pgvector_python_test', client_encoding='SQL_ASCII')
+        assert new_conn.info.encoding == 'ascii'
+        register_vector(new_conn)
+        assert new_conn.info.encoding == 'ascii'
+        res = new_conn.execute("SELECT '[1,2,3]'::vector").fetchone()
+        assert np.array_equal(res[0], [1, 2, 3])
+        new_conn.close()
+
+    def test_stream_neighbors(self):
+        embeddings = [np.array([i, i, i]) for i in range(1, 6)]
+        for embedding in embeddings:
+            conn.execute('INSERT INTO psycopg_items (embedding) VALUES (%s)', (embedding,))
+
+        batches = list(stream_neighbors(conn, 'psycopg_items', 'embedding', np.array([5, 5, 5]), batch_size=2))
+        assert [len(ids) for ids, _, _ in batches] == [2, 2, 1]
+
+        ids = np.concatenate([ids for ids, _, _ in batches])
+        distances = np.concatenate([distances for _, distances, _ in batches])
+        vectors = np.concatenate([vectors for _, _, vectors in batches])
+        assert np.array_equal(vectors, embeddings[::-1])
+        assert np.all(np.diff(distances) > 0)
+        assert distances[0] == 0
+        assert vectors.dtype == np.float32
+        assert len(set(ids)) == 5
+
+    def test_stream_neighbors_options(self):
+        for i in range(1, 6):
+            conn.execute('INSERT INTO psycopg_items (embedding) VALUES (%s)', (np.array([i, i, i]),))
+
+        batches = list(stream_neighbors(conn, 'psycopg_items', 'embedding', np.array([1, 1, 1]), distance='l1_distance', where='embedding <> %s', params=(np.array([1, 1, 1]),), limit=3, vectors=False))
+        assert len(batches) == 1
+        ids, distances, vectors = batches[0]
+        assert np.array_equal(distances, [3, 6, 9])
+        assert vectors is None
+
+    def test_stream_neighbors_unknown_distance(self):
+        with pytest.raises(ValueError, match='unknown distance: other'):
+            list(stream_neighbors(conn, 'psycopg_items', 'embedding', np.array([1, 1, 1]), distance='other'))
+
+    def test_batch_neighbors(self):
+        for i in range(1, 6):
+            conn.execute('INSERT INTO psycopg_items (embedding, half_embedding) VALUES (%s, %s)', (np.array([i, i, i]), HalfVector([i, i, i])))
+
+        ids, distances = batch_neighbors(conn, 'psycopg_items', 'embedding', np.array([[1, 1, 1], [5, 5, 5]]), k=3)
+        assert ids.shape == (2, 3)
+        assert distances[:, 0].tolist() == [0, 0]
+        assert np.all(np.diff(distances, axis=1) > 0)
+        assert ids[0, 2] == ids[1, 2]
+
+        ids, distances = batch_neighbors(conn, 'psycopg_items', 'half_embedding', [[1, 1, 1]], k=6, distance='l1_distance', where='id <> %s', params=(int(ids[0, 0]),), type='halfvec')
+        assert distances.tolist() == [[3, 6, 9, 12, np.inf, np.inf]]
+        assert ids[0, 4] == -1
+
+    def test_batch_neighbors_bit(self):
+        conn.execute('INSERT INTO psycopg_items (binary_embedding) VALUES (%s), (%s), (%s)', (Bit('000'), Bit('101'), Bit('111')))
+
+        ids, distances = batch_neighbors(conn, 'psycopg_items', 'binary_embedding', [Bit('100')], k=2, distance='jaccard_distance', where='binary_embedding IS NOT NULL', type='bit')
+        assert distances.tolist() == [[0.5, 1 - 1 / 3]]
+
+        batches = list(stream_neighbors(conn, 'psycopg_items', 'binary_embedding', Bit('101'), distance='<%>', vectors=False, batch_size=10))
+        assert batches[0][1].tolist() == [0, 1 - 2 / 3, 1]
+
+    def test_stream_neighbors_bit(self):
+        conn.execute('INSERT INTO psycopg_items (binary_embedding) VALUES (%s), (%s), (%s)', (Bit('000'), Bit('101'), Bit('111')))
+
+        batches = list(stream_neighbors(conn, 'psycopg_items', 'binary_embedding', Bit('101'), distance='hamming_distance', where='binary_embedding IS NOT NULL'))
+        assert len(batches) == 1
+        _, distances, vectors = batches[0]
+        assert distances.tolist() == [0, 1, 2]
+        assert vectors.dtype == np.uint8
+        assert np.unpackbits(vectors, axis=1, count=3).tolist() == [[1, 0, 1], [1, 1, 1], [0, 0, 0]]
+
+        batches = list(stream_neighbors(conn, 'psycopg_items', 'binary_embedding', Bit('101'), distance='jaccard_distance', where='binary_embedding IS NOT NULL'))
+        assert batches[0][1].tolist() == [0, 1 - 2 / 3, 1]
+        assert batches[0][2].shape == (3, 1)
+
+    def test_cached_neighbors(self):
+        for i in range(1, 6):
+            conn.execute('INSERT INTO psycopg_items (id, embedding) VALUES (%s, %s)', (i, np.array([i, i, i])))
+
+        cache = NeighborCache()
+        for _ in range(3):
+            ids, distances = cached_neighbors(conn, cache, 'psycopg_items', 'embedding', [1, 1, 1], k=2, distance='l1_distance', where='id <> %s', params=(2,))
+            assert ids.tolist() == [1, 3]
+            assert distances.tolist() == [0, 6]
+        assert cache.info()['hits'] == 2
+        assert cache.info()['misses'] == 1
+
+        conn.execute('DELETE FROM psycopg_items WHERE id = 1')
+        assert cached_neighbors(conn, cache, 'psycopg_items', 'embedding', [1, 1, 1], k=2, distance='l1_distance', where='id <> %s', params=(2,))[0].tolist() == [1, 3]
+        cache.invalidate('psycopg_items')
+        assert cached_neighbors(conn, cache, 'psycopg_items', 'embedding', [1, 1, 1], k=2, distance='l1_distance', where='id <> %s', params=(2,))[0].tolist() == [3, 4]
+
+    def test_embedding_cache(self):
+        conn.execute('DROP TABLE IF EXISTS psycopg_embedding_cache')
+        calls = []
+
+        def embed(contents):
+            calls.append(contents)
+            return [[len(c), 1, 2] for c in contents]
+
+        cache = EmbeddingCache(conn, 'psycopg_embedding_cache', 3, embed)
+        cache.create_table()
+
+        embeddings = cache.get(['a', 'bb', 'a'])
+        assert embeddings.tolist() == [[1, 1, 2], [2, 1, 2], [1, 1, 2]]
+        assert calls == [['a', 'bb']]
+
+        embeddings = cache.get(['bb', 'ccc'])
+        assert embeddings.tolist() == [[2, 1, 2], [3, 1, 2]]
+        assert calls[-1] == ['ccc']
+        assert cache.info()['hits'] == 1
+        assert cache.info()['misses'] == 3
+
+        # another process
+        new_cache = EmbeddingCache(conn, 'psycopg_embedding_cache', 3, embed, maxsize=1)
+        assert new_cache.get(['ccc', 'a']).tolist() == [[3, 1, 2], [1, 1, 2]]
+        assert len(calls) == 2
+        assert new_cache.info()['db_hits'] == 2
+        assert new_cache.info()['hit_rate'] == 1
+        assert new_cache.info()['size'] == 1
+        assert conn.execute('SELECT COUNT(*) FROM psycopg_embedding_cache').fetchone()[0] == 3
+
+    def test_embedding_cache_dimensions(self):
+        conn.execute('DROP TABLE IF EXISTS psycopg_embedding_cache')
+        cache = EmbeddingCache(conn, 'psycopg_embedding_cache', 3, lambda contents: [[1, 2] for _ in contents], type='halfvec')
+        cache.create_table()
+        with pytest.raises(ValueError, match='expected 1 embeddings with 3 dimensions'):
+            cache.get(['a'])
+
+    def test_hybrid_search(self):
+        conn.execute('DROP TABLE IF EXISTS psycopg_documents')
+        conn.execute('CREATE TABLE psycopg_documents (id bigint PRIMARY KEY, content text, embedding vector(3))')
+        documents = [
+            (1, 'The dog is barking', [1, 0, 0]),
+            (2, 'The cat is purring', [0, 1, 0]),
+            (3, 'The bear is growling', [0, 0, 1]),
+            (4, 'The bear is sleeping', [1, 1, 0])
+        ]
+        for id, content, embedding in documents:
+            conn.execute('INSERT INTO psycopg_documents (id, content, embedding) VALUES (%s, %s, %s)', (id, content, np.array(embedding)))
+
+        ids, scores = hybrid_search(conn, 'psycopg_documents', 'embedding', 'content', [1, 0, 0.1], 'growling bear')
+        assert ids.tolist() == [3, 1, 4, 2]
+        assert np.allclose(scores, [1 / 63 + 1 / 61, 1 / 61, 1 / 62, 1 / 64])
+
+        ids, _ = hybrid_search(conn, 'psycopg_documents', 'embedding', 'content', [1, 0, 0.1], 'growling bear', limit=2, weights=(1, 0))
+        assert ids.tolist() == [1, 4]
+
+        ids, scores = hybrid_search(conn, 'psycopg_documents', 'embedding', 'content', [1, 0, 0.1], 'growling bear', k=1, candidates=1, where='id <> %s', params=(1,))
+        assert ids.tolist() == [3, 4]
+        assert scores.tolist() == [0.5, 0.5]
+
+    def test_fused_search(self):
+        conn.execute('DROP TABLE IF EXISTS psycopg_documents')
+        conn.execute('CREATE TABLE psycopg_documents (id bigint PRIMARY KEY, content text, embedding vector(3), sparse_embedding sparsevec(3), binary_embedding bit(3))')
+        documents = [
+            (1, 'The dog is barking', [1, 0, 0], '100'),
+            (2, 'The cat is purring', [0, 1, 0], '010'),
+            (3, 'The bear is growling', [0, 0, 1], '001'),
+            (4, 'The bear is sleeping', [1, 1, 0], '110')
+        ]
+        for id, content, embedding, binary_embedding in documents:
+            conn.execute('INSERT INTO psycopg_documents (id, content, embedding, sparse_embedding, binary_embedding) VALUES (%s, %s, %s, %s, %s)', (id, content, np.array(embedding), SparseVector(embedding), Bit(binary_embedding)))
+
+        retrievers = [
+            vector_retriever('psycopg_documents', 'embedding', [1, 0, 0.1]),
+            vector_retriever('psycopg_documents', 'sparse_embedding', [0.5, 1, 0], distance='max_inner_product', type='sparsevec', candidates=2),
+            vector_retriever('psycopg_documents', 'binary_embedding', '001', distance='hamming_distance', type='bit', where='id <> %s', params=(4,), candidates=1),
+            text_retriever('psycopg_documents', 'content', 'growling bear')
+        ]
+        ids, scores = fused_search(conn, retrievers)
+        assert ids.tolist() == [3, 4, 2, 1]
+        assert np.allclose(scores, [1 / 63 + 1 / 61 + 1 / 61, 1 / 62 + 1 / 61, 1 / 64 + 1 / 62, 1 / 61])
+
+        ids, _ = fused_search(conn, retrievers, weights=(0, 1, 0, 0), limit=2)
+        assert ids.tolist() == [4, 2]
+
+        ids, scores = fused_search(conn, retrievers[:1], method='score')
+        assert ids.tolist() == [1, 4, 3, 2]
+        assert scores[0] == 1
+        assert scores[-1] == 0
+
+        query, params = fusion_query(retrievers, limit=3)
+        assert len(params) == 5
+        assert query.as_string(conn).endswith('LIMIT 3')
+
+        with pytest.raises(ValueError, match='expected 4 weights, not 2'):
+            fusion_query(retrievers, weights=(1, 1))
+
+        with pytest.raises(ValueError, match='unknown method: other'):
+            fusion_query(retrievers, method='other')
+
+    def test_pipeline_neighbors(self):
+        for i in range(1, 6):
+            conn.execute('INSERT INTO psycopg_items (embedding, half_embedding) VALUES (%s, %s)', (np.array([i, i, i]), HalfVector([i, i, i])))
+
+        searches = [
+            {'table': 'psycopg_items', 'column': 'embedding', 'query': np.array([1, 1, 1]), 'k': 2, 'distance': 'l1_distance'},
+            {'table': 'psycopg_items', 'column': 'half_embedding', 'query': HalfVector([5, 5, 5]), 'k': 3, 'distance': 'l1_distance', 'where': 'id > %s', 'params': (0,)}
+        ]
+        results = pipeline_neighbors(conn, searches)
+        assert len(results) == 2
+        assert results[0][1].tolist() == [0, 3]
+        assert results[1][1].tolist() == [0, 3, 6]
+        assert conn.info.transaction_status == psycopg.pq.TransactionStatus.IDLE
+
     @pytest.mark.asyncio
     async def test_async(self):
         conn = await psycopg.AsyncConnection.connect(dbname='pgvector_python_test', autocommit=True)
@@ -206,6 +444,68 @@ class TestPsycopg:
             assert res[0][1].dtype == np.float32
             assert res[1][1] is None
 
+    def test_prepared_neighbors(self):
+        conn.execute('DROP TABLE IF EXISTS psycopg_prepared_items')
+        conn.execute('CREATE TABLE psycopg_prepared_items (id bigserial PRIMARY KEY, embedding vector(3))')
+        for i in range(1, 6):
+            conn.execute('INSERT INTO psycopg_prepared_items (embedding) VALUES (%s)', (np.array([i, i, i]),))
+
+        search = PreparedNeighbors(conn, 'psycopg_prepared_items', 'embedding', k=2, where='id <> %s')
+        for _ in range(10):
+            ids, distances = search.search(np.array([1, 1, 1]), params=(2,))
+            assert ids.tolist() == [1, 3]
+            assert distances.tolist()[0] == 0
+
+        stats = search.stats()
+        assert stats['executions'] == 10
+        assert stats['generic_plans'] + stats['custom_plans'] == 10
+        assert stats['planning_time'] > 0
+        assert stats['planning_time_saved'] == stats['planning_time'] * stats['generic_plans']
+
+    def test_tune_search(self):
+        conn.execute('DROP TABLE IF EXISTS psycopg_tune_items')
+        conn.execute('CREATE TABLE psycopg_tune_items (id bigserial PRIMARY KEY, embedding vector(3))')
+        embeddings = np.random.default_rng(1).random((500, 3))
+        with conn.cursor().copy('COPY psycopg_tune_items (embedding) FROM STDIN') as copy:
+            for embedding in embeddings:
+                copy.write_row([Vector(embedding).to_text()])
+        conn.execute('CREATE INDEX ON psycopg_tune_items USING hnsw (embedding vector_l2_ops) WITH (m = 4, ef_construction = 8)')
+        conn.execute('ANALYZE psycopg_tune_items')
+
+        queries = embeddings[:5]
+        results = tune_search(conn, 'psycopg_tune_items', 'embedding', queries, k=5, iterative_scan='relaxed_order')
+        assert results[0]['settings'] is None
+        assert results[0]['recall'] == 1
+        assert [r['settings']['hnsw.ef_search'] for r in results[1:]] == [10, 20, 40, 80, 160, 320]
+        assert all(r['settings']['hnsw.iterative_scan'] == 'relaxed_order' for r in results[1:])
+        assert all(0 <= r['recall'] <= 1 and r['latency'] > 0 for r in results)
+        assert results[-1]['recall'] == 1
+
+        results = tune_search(conn, 'psycopg_tune_items', 'embedding', queries, k=5, where='id > %s', params=(100,), settings=[{'hnsw.ef_search': 1}])
+        assert len(results) == 2
+
+        # settings do not leak
+        assert conn.execute('SHOW hnsw.ef_search').fetchone()[0] == '40'
+
+        conn.execute('CREATE TABLE IF NOT EXISTS psycopg_tune_no_index (id bigserial PRIMARY KEY, embedding vector(3))')
+        with pytest.raises(ValueError, match='no hnsw or ivfflat index on embedding'):
+            tune_search(conn, 'psycopg_tune_no_index', 'embedding', queries)
+
+    def test_tune_search_ties(self):
+        conn.execute('DROP TABLE IF EXISTS psycopg_tune_items')
+        conn.execute('CREATE TABLE psycopg_tune_items (id bigserial PRIMARY KEY, embedding bit(8))')
+        # many rows at the same distance from each query
+        embeddings = np.random.default_rng(1).integers(0, 2, (4, 8), dtype=bool).repeat(100, axis=0)
+        with conn.cursor().copy('COPY psycopg_tune_items (embedding) FROM STDIN') as copy:
+            for embedding in embeddings:
+                copy.write_row([Bit(embedding).to_text()])
+        conn.execute('CREATE INDEX ON psycopg_tune_items USING hnsw (embedding bit_hamming_ops)')
+        conn.execute('ANALYZE psycopg_tune_items')
+
+        queries = embeddings[::100]
+        results = tune_search(conn, 'psycopg_tune_items', 'embedding', queries, k=10, distance='hamming_distance', type='bit', settings=[{'enable_seqscan': 'off', 'hnsw.ef_search': 40}])
+        assert [r['recall'] for r in results] == [1, 1]
+
     @pytest.mark.asyncio
     async def test_async_pool(self):
         async def configure(conn):
@@ -221,3 +521,142 @@ class TestPsycopg:
                 assert np.array_equal(res[0], [1, 2, 3])
 
         await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_async_pool_configure_vector(self):
+        pool = AsyncConnectionPool(conninfo='postgres://localhost/pgvector_python_test', min_size=2, open=False, configure=configure_vector_async())
+        await pool.open()
+
+        for _ in range(2):
+            async with pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute("SELECT '[1,2,3]'::vector, '[1,2,3]'::halfvec")
+                    res = await cur.fetchone()
+                    assert np.array_equal(res[0], [1, 2, 3])
+                    assert res[1] == HalfVector([1, 2, 3])
+
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_async_fetch_type_info_sql_ascii(self):
+        conn = await psycopg.AsyncConnection.connect(dbname='pgvector_python_test', client_encoding='SQL_ASCII')
+        await register_vector_async(conn)
+        assert conn.info.encoding == 'ascii'
+        async with conn.cursor() as cur:
+            await cur.execute("SELECT '[1,2,3]'::vector")
+            res = await cur.fetchone()
+            assert np.array_equal(res[0], [1, 2, 3])
+        await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_async_fetch_type_info(self):
+        conn = await psycopg.AsyncConnection.connect(dbname='pgvector_python_test')
+        type_info = await fetch_type_info_async(conn)
+        assert sorted(type_info.keys()) == ['bit', 'halfvec', 'sparsevec', 'vector']
+        assert conn.info.transaction_status == psycopg.pq.TransactionStatus.IDLE
+
+        new_conn = await psycopg.AsyncConnection.connect(dbname='pgvector_python_test')
+        await register_vector_async(new_conn, type_info)
+        async with new_conn.cursor() as cur:
+            await cur.execute("SELECT '[1,2,3]'::vector")
+            res = await cur.fetchone()
+            assert np.array_equal(res[0], [1, 2, 3])
+
+        await conn.close()
+        await new_conn.close()
+
+    @pytest.mark.asyncio
+    async def test_async_stream_neighbors(self):
+        conn = await psycopg.AsyncConnection.connect(dbname='pgvector_python_test', autocommit=True)
+        await register_vector_async(conn)
+
+        await conn.execute('DROP TABLE IF EXISTS psycopg_stream_items')
+        await conn.execute('CREATE TABLE psycopg_stream_items (id bigserial PRIMARY KEY, embedding vector(3))')
+        for i in range(1, 6):
+            await conn.execute('INSERT INTO psycopg_stream_items (embedding) VALUES (%s)', (np.array([i, i, i]),))
+
+        batches = [batch async for batch in stream_neighbors_async(conn, 'psycopg_stream_items', 'embedding', np.array([1, 1, 1]), batch_size=2)]
+        ids = np.concatenate([ids for ids, _, _ in batches])
+        assert ids.tolist() == [1, 2, 3, 4, 5]
+        assert [len(ids) for ids, _, _ in batches] == [2, 2, 1]
+
+        await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_async_batch_neighbors(self):
+        conn = await psycopg.AsyncConnection.connect(dbname='pgvector_python_test', autocommit=True)
+        await register_vector_async(conn)
+
+        await conn.execute('DROP TABLE IF EXISTS psycopg_batch_items')
+        await conn.execute('CREATE TABLE psycopg_batch_items (id bigserial PRIMARY KEY, embedding vector(3))')
+        for i in range(1, 6):
+            await conn.execute('INSERT INTO psycopg_batch_items (embedding) VALUES (%s)', (np.array([i, i, i]),))
+
+        ids, distances = await batch_neighbors_async(conn, 'psycopg_batch_items', 'embedding', np.array([[1, 1, 1], [5, 5, 5]]), k=2)
+        assert ids.tolist() == [[1, 2], [5, 4]]
+
+        await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_async_pipeline_neighbors(self):
+        conn = await psycopg.AsyncConnection.connect(dbname='pgvector_python_test', autocommit=True)
+        await register_vector_async(conn)
+
+        await conn.execute('DROP TABLE IF EXISTS psycopg_pipeline_items')
+        await conn.execute('CREATE TABLE psycopg_pipeline_items (id bigserial PRIMARY KEY, embedding vector(3))')
+        for i in range(1, 6):
+            await conn.execute('INSERT INTO psycopg_pipeline_items (embedding) VALUES (%s)', (np.array([i, i, i]),))
+
+        searches = [{'table': 'psycopg_pipeline_items', 'column': 'embedding', 'query': np.array([i, i, i]), 'k': 2} for i in [1, 5]]
+        results = await pipeline_neighbors_async(conn, searches)
+        assert [ids.tolist() for ids, _ in results] == [[1, 2], [5, 4]]
+
+        await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_neighbors(self):
+        conn = await psycopg.AsyncConnection.connect(dbname='pgvector_python_test', autocommit=True)
+        await conn.execute('DROP TABLE IF EXISTS psycopg_concurrent_items')
+        await conn.execute('CREATE TABLE psycopg_concurrent_items (id bigserial PRIMARY KEY, embedding vector(3))')
+        for i in range(1, 6):
+            await conn.execute('INSERT INTO psycopg_concurrent_items (embedding) VALUES (%s::vector)', (str([i, i, i]),))
+        await conn.close()
+
+        pool = AsyncConnectionPool(conninfo='postgres://localhost/pgvector_python_test', min_size=2, max_size=2, open=False, configure=configure_vector_async())
+        await pool.open()
+
+        queries = np.array([[i, i, i] for i in [1, 5, 5, 1]])
+        ids, distances, timings = await concurrent_neighbors(pool, 'psycopg_concurrent_items', 'embedding', queries, k=2)
+        assert ids.tolist() == [[1, 2], [5, 4], [5, 4], [1, 2]]
+        assert distances[:, 0].tolist() == [0, 0, 0, 0]
+        assert timings.shape == (4,)
+        assert (timings > 0).all()
+
+        ids, _, _ = await concurrent_neighbors(pool, 'psycopg_concurrent_items', 'embedding', [[1, 1, 1]], k=6, where='id <> %s', params=(1,), concurrency=1)
+        assert ids.tolist() == [[2, 3, 4, 5, -1, -1]]
+
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_async_prepared_neighbors(self):
+        conn = await psycopg.AsyncConnection.connect(dbname='pgvector_python_test', autocommit=True)
+        await register_vector_async(conn)
+
+        await conn.execute('DROP TABLE IF EXISTS psycopg_prepared_items')
+        await conn.execute('CREATE TABLE psycopg_prepared_items (id bigserial PRIMARY KEY, embedding vector(3))')
+        for i in range(1, 6):
+            await conn.execute('INSERT INTO psycopg_prepared_items (embedding) VALUES (%s)', (np.array([i, i, i]),))
+
+        search = AsyncPreparedNeighbors(conn, 'psycopg_prepared_items', 'embedding', k=2)
+        assert (await search.stats())['planning_time_saved'] is None
+
+        for _ in range(10):
+            ids, _ = await search.search(np.array([5, 5, 5]))
+            assert ids.tolist() == [5, 4]
+
+        stats = await search.stats()
+        assert stats['executions'] == 10
+        assert stats['generic_plans'] + stats['custom_plans'] == 10
+        assert stats['planning_time'] > 0
+
+        await conn.close()
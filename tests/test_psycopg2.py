@@ -1,6 +1,6 @@
 import numpy as np
 from pgvector import HalfVector, SparseVector, Vector
-from pgvector.psycopg2 import register_vector
+from pgvector.psycopg2 import fetch_type_info, register_vector
 import psycopg2
 from psycopg2.extras import DictCursor, RealDictCursor, NamedTupleCursor
 from psycopg2.pool import ThreadedConnectionPool
@@ -134,3 +134,14 @@ class TestPsycopg2:
             pool.putconn(conn)
 
         pool.closeall()
+
+    def test_fetch_type_info(self):
+        type_info = fetch_type_info(conn)
+
+        new_conn = psycopg2.connect(dbname='pgvector_python_test')
+        register_vector(new_conn, type_info=type_info)
+        new_cur = new_conn.cursor()
+        new_cur.execute("SELECT '[1,2,3]'::vector")
+        res = new_cur.fetchone()
+        assert np.array_equal(res[0], [1, 2, 3])
+        new_conn.close()
@@ -22,6 +22,18 @@ class TestSparseVector:
         assert vec.to_list() == [1, 0, 2, 0, 3, 0]
         assert vec.indices() == [0, 2, 4]
 
+    def test_ndarray_float32(self):
+        arr = np.array([0.1, 0, 2.5], dtype=np.float32)
+        vec = SparseVector(arr)
+        assert vec.indices() == [0, 2]
+        assert vec.values() == [float(arr[0]), 2.5]
+        assert vec.to_text() == SparseVector(arr.tolist()).to_text()
+
+    def test_ndarray_ndim_two(self):
+        with pytest.raises(ValueError) as error:
+            SparseVector(np.array([[1, 0], [0, 1]]))
+        assert str(error.value) == 'expected ndim to be 1'
+
     def test_dict(self):
         vec = SparseVector({2: 2, 4: 3, 0: 1, 3: 0}, 6)
         assert vec.to_list() == [1, 0, 2, 0, 3, 0]
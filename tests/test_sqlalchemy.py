@@ -1,10 +1,11 @@
 import asyncpg
 from getpass import getuser
 import numpy as np
-from pgvector import HalfVector, SparseVector, Vector
-from pgvector.sqlalchemy import VECTOR, HALFVEC, BIT, SPARSEVEC, avg, sum
+from pgvector import Bit, HalfVector, SparseVector, Vector
+from pgvector.cache import NeighborCache
+from pgvector.sqlalchemy import VECTOR, HALFVEC, BIT, SPARSEVEC, avg, sum, column_matrix, column_matrix_async, HnswIndex, IvfflatIndex, batch_neighbors, bulk_insert, hybrid_search, bulk_insert_async, fused_search, fusion_query, text_retriever, vector_retriever, cached_neighbors, invalidate_on_commit, knn, register_vector
 import pytest
-from sqlalchemy import create_engine, event, insert, inspect, select, text, MetaData, Table, Column, Index, Integer, ARRAY
+from sqlalchemy import create_engine, event, insert, inspect, select, text, MetaData, Table, Column, CHAR, Enum, Index, Integer, Text, ARRAY
 from sqlalchemy.exc import StatementError
 from sqlalchemy.ext.automap import automap_base
 from sqlalchemy.orm import declarative_base, Session
@@ -55,17 +56,25 @@ if sqlalchemy_version > 1:
         from pgvector.asyncpg import register_vector
         dbapi_connection.run_async(register_vector)
 
+    # binary bind and result processing
+    psycopg_binary_engine = create_engine('postgresql+psycopg://localhost/pgvector_python_test')
+    register_vector(psycopg_binary_engine)
+    psycopg_async_binary_engine = create_async_engine('postgresql+psycopg://localhost/pgvector_python_test')
+    register_vector(psycopg_async_binary_engine)
+    asyncpg_binary_engine = create_async_engine('postgresql+asyncpg://localhost/pgvector_python_test')
+    register_vector(asyncpg_binary_engine)
+
 engines = [psycopg2_engine, psycopg2_type_engine, pg8000_engine]
 array_engines = [psycopg2_type_engine]
 async_engines = []
 async_array_engines = []
 
 if sqlalchemy_version > 1:
-    engines += [psycopg_engine, psycopg_type_engine]
-    array_engines += [psycopg_type_engine]
-    # TODO support asyncpg_type_engine
-    async_engines += [psycopg_async_engine, psycopg_async_type_engine, asyncpg_engine]
-    async_array_engines += [psycopg_async_type_engine, asyncpg_engine]
+    engines += [psycopg_engine, psycopg_type_engine, psycopg_binary_engine]
+    array_engines += [psycopg_type_engine, psycopg_binary_engine]
+    # TODO support asyncpg_type_engine (use register_vector instead)
+    async_engines += [psycopg_async_engine, psycopg_async_type_engine, asyncpg_engine, psycopg_async_binary_engine, asyncpg_binary_engine]
+    async_array_engines += [psycopg_async_type_engine, asyncpg_engine, psycopg_async_binary_engine, asyncpg_binary_engine]
 
 setup_engine = engines[0]
 with Session(setup_engine) as session:
@@ -87,16 +96,21 @@ class Item(Base):
     half_embeddings = mapped_column(ARRAY(HALFVEC(3)))
 
 
+class Document(Base):
+    __tablename__ = 'sqlalchemy_orm_document'
+
+    id = mapped_column(Integer, primary_key=True)
+    content = mapped_column(Text)
+    embedding = mapped_column(VECTOR(3))
+    sparse_embedding = mapped_column(SPARSEVEC(3))
+
+
+color_table = Table('sqlalchemy_color_item', Base.metadata, Column('id', Integer, primary_key=True), Column('color', Enum('red', 'green', name='sqlalchemy_color')), Column('code', CHAR(2)), Column('embedding', VECTOR(3)))
+
 Base.metadata.drop_all(setup_engine)
 Base.metadata.create_all(setup_engine)
 
-index = Index(
-    'sqlalchemy_orm_index',
-    Item.embedding,
-    postgresql_using='hnsw',
-    postgresql_with={'m': 16, 'ef_construction': 64},
-    postgresql_ops={'embedding': 'vector_l2_ops'}
-)
+index = HnswIndex('sqlalchemy_orm_index', Item.embedding, 'vector_l2_ops', m=16, ef_construction=64)
 index.create(setup_engine)
 
 half_precision_index = Index(
@@ -116,6 +130,11 @@ binary_quantize_index = Index(
 binary_quantize_index.create(setup_engine)
 
 
+# same column with Bit objects and packed arrays
+bit_table = Table('sqlalchemy_orm_item', MetaData(), Column('id', Integer, primary_key=True), Column('binary_embedding', BIT(3, output='bit')))
+packed_table = Table('sqlalchemy_orm_item', MetaData(), Column('id', Integer, primary_key=True), Column('binary_embedding', BIT(3, output='packed')))
+
+
 def create_items():
     with Session(setup_engine) as session:
         session.add(Item(id=1, embedding=[1, 1, 1], half_embedding=[1, 1, 1], binary_embedding='000', sparse_embedding=SparseVector([1, 1, 1])))
@@ -124,6 +143,16 @@ def create_items():
         session.commit()
 
 
+def create_documents():
+    with Session(setup_engine) as session:
+        session.query(Document).delete()
+        session.add(Document(id=1, content='The dog is barking', embedding=[1, 0, 0], sparse_embedding=SparseVector([1, 0, 0])))
+        session.add(Document(id=2, content='The cat is purring', embedding=[0, 1, 0], sparse_embedding=SparseVector([0, 1, 0])))
+        session.add(Document(id=3, content='The bear is growling', embedding=[0, 0, 1], sparse_embedding=SparseVector([0, 0, 1])))
+        session.add(Document(id=4, content='The bear is sleeping', embedding=[1, 1, 0], sparse_embedding=SparseVector([1, 1, 0])))
+        session.commit()
+
+
 def delete_items():
     with Session(setup_engine) as session:
         session.query(Item).delete()
@@ -311,6 +340,28 @@ class TestSqlalchemy:
             item = session.get(Item, 1)
             assert item.binary_embedding == '101'
 
+    def test_bit_object(self, engine):
+        with engine.begin() as conn:
+            conn.execute(insert(bit_table), [{'id': 1, 'binary_embedding': Bit('101')}, {'id': 2, 'binary_embedding': np.array([True, True, False])}, {'id': 3, 'binary_embedding': None}])
+            assert conn.execute(select(bit_table.c.binary_embedding).order_by(bit_table.c.id)).scalars().all() == [Bit('101'), Bit('110'), None]
+            assert conn.execute(select(bit_table.c.id).order_by(bit_table.c.binary_embedding.hamming_distance(Bit('100')), bit_table.c.id).where(bit_table.c.id < 3)).scalars().all() == [1, 2]
+
+    def test_bit_packed(self, engine):
+        with engine.begin() as conn:
+            conn.execute(insert(packed_table), [{'id': 1, 'binary_embedding': np.packbits([1, 0, 1])}, {'id': 2, 'binary_embedding': '011'}])
+            values = conn.execute(select(packed_table.c.binary_embedding).order_by(packed_table.c.id)).scalars().all()
+            assert [v.tolist() for v in values] == [[160], [96]]
+            assert values[0].dtype == np.uint8
+
+            item = Session(conn).get(Item, 1)
+            assert item.binary_embedding == '101'
+
+    def test_bit_bad_output(self, engine):
+        with pytest.raises(ValueError, match='unknown output: bytes'):
+            BIT(3, output='bytes')
+        with pytest.raises(ValueError, match='packed output requires length'):
+            BIT(output='packed')
+
     def test_bit_hamming_distance(self, engine):
         create_items()
         with Session(engine) as session:
@@ -493,6 +544,49 @@ class TestSqlalchemy:
         with Session(engine) as session:
             session.execute(insert(Item), [{'embedding': np.array([1, 2, 3])}])
 
+    def test_bulk_insert(self, engine):
+        rows = [
+            {'id': 1, 'embedding': np.array([1, 2, 3]), 'half_embedding': [1, 2, 3], 'binary_embedding': '101', 'sparse_embedding': SparseVector([1, 0, 3])},
+            {'id': 2, 'embedding': [4, 5, 6], 'half_embedding': None, 'binary_embedding': None, 'sparse_embedding': None}
+        ]
+        with Session(engine) as session:
+            assert bulk_insert(session, Item, rows, min_copy_rows=1) == 2
+            items = session.scalars(select(Item).order_by(Item.id)).all()
+            assert np.array_equal(items[0].embedding, [1, 2, 3])
+            assert items[0].half_embedding == HalfVector([1, 2, 3])
+            assert items[0].binary_embedding == '101'
+            assert items[0].sparse_embedding == SparseVector([1, 0, 3])
+            assert np.array_equal(items[1].embedding, [4, 5, 6])
+            assert items[1].half_embedding is None
+
+    def test_bulk_insert_table(self, engine):
+        with Session(engine) as session:
+            assert bulk_insert(session, Item.__table__, [{'id': i, 'embedding': [i, i, i]} for i in range(1, 4)], min_copy_rows=1) == 3
+            assert bulk_insert(session, Item.__table__, [{'id': 4, 'embedding': [4, 4, 4]}]) == 1
+            assert bulk_insert(session, Item.__table__, []) == 0
+            assert session.scalars(select(Item.id).order_by(Item.embedding.l2_distance([4, 4, 4]))).all() == [4, 3, 2, 1]
+            session.rollback()
+            assert session.scalars(select(Item.id)).all() == []
+
+    def test_bulk_insert_enum(self, engine):
+        with Session(engine) as session:
+            session.execute(color_table.delete())
+            rows = [{'id': 1, 'color': 'red', 'embedding': [1, 2, 3]}, {'id': 2, 'color': 'green', 'embedding': [4, 5, 6]}]
+            assert bulk_insert(session, color_table, rows, min_copy_rows=1) == 2
+            assert session.execute(select(color_table.c.id, color_table.c.color).order_by(color_table.c.id)).all() == [(1, 'red'), (2, 'green')]
+
+    def test_bulk_insert_char(self, engine):
+        with Session(engine) as session:
+            session.execute(color_table.delete())
+            rows = [{'id': i, 'code': 'ab', 'embedding': [i, i, i]} for i in range(1, 11)]
+            assert bulk_insert(session, color_table, rows, min_copy_rows=5) == 10
+            assert session.execute(select(color_table.c.code).distinct()).scalars().all() == ['ab']
+
+    def test_bulk_insert_bad_dimensions(self, engine):
+        with Session(engine) as session:
+            with pytest.raises(Exception, match='expected 3 dimensions, not 2'):
+                bulk_insert(session, Item, [{'embedding': [1, 2]}], min_copy_rows=1)
+
     # register_vector in psycopg2 tests change this behavior
     # def test_insert_text(self):
     #     with Session(engine) as session:
@@ -526,6 +620,157 @@ class TestSqlalchemy:
             items = session.query(Item).order_by(distance).all()
             assert [v.id for v in items] == [2, 3, 1]
 
+    def test_batch_neighbors(self, engine):
+        create_items()
+        with Session(engine) as session:
+            ids, distances = batch_neighbors(session, Item.id, Item.embedding, np.array([[1, 1, 1], [2, 2, 2]]), k=2, distance='l1_distance')
+            assert ids.tolist() == [[1, 3], [2, 3]]
+            assert distances.tolist() == [[0, 1], [0, 2]]
+
+    def test_batch_neighbors_options(self, engine):
+        create_items()
+        with Session(engine) as session:
+            ids, distances = batch_neighbors(session, Item.id, Item.half_embedding, [[1, 1, 1]], k=4, distance='l1_distance', where=Item.id != 1)
+            assert ids.tolist() == [[3, 2, -1, -1]]
+            assert distances.tolist() == [[1, 3, np.inf, np.inf]]
+
+    def test_column_matrix(self, engine):
+        create_items()
+        with Session(engine) as session:
+            result = session.execute(select(Item.id, Item.embedding).order_by(Item.id).execution_options(yield_per=2))
+            matrix = column_matrix(result, 1)
+            assert matrix.dtype == np.float32
+            assert matrix.flags['C_CONTIGUOUS']
+            assert matrix.tolist() == [[1, 1, 1], [2, 2, 2], [1, 1, 2]]
+
+            matrix = column_matrix(session.execute(select(Item.half_embedding).order_by(Item.id)), dtype=np.float16)
+            assert matrix.dtype == np.float16
+            assert matrix.tolist() == [[1, 1, 1], [2, 2, 2], [1, 1, 2]]
+
+            assert column_matrix(session.execute(select(Item.sparse_embedding).order_by(Item.id)))[2].tolist() == [1, 1, 2]
+            assert column_matrix(session.execute(select(Item.embedding).where(Item.id > 3))).shape == (0, 0)
+
+    def test_column_matrix_null(self, engine):
+        with Session(engine) as session:
+            session.add(Item(id=1))
+            session.commit()
+
+            with pytest.raises(ValueError, match='expected non-null values'):
+                column_matrix(session.execute(select(Item.embedding)))
+
+    def test_hybrid_search(self, engine):
+        create_documents()
+        with Session(engine) as session:
+            ids, scores = hybrid_search(session, Document.id, Document.embedding, Document.content, [1, 0, 0.1], 'growling bear')
+            assert ids.tolist() == [3, 1, 4, 2]
+            assert np.allclose(scores, [1 / 63 + 1 / 61, 1 / 61, 1 / 62, 1 / 64])
+
+            ids, _ = hybrid_search(session, Document.id, Document.embedding, Document.content, [1, 0, 0.1], 'growling bear', limit=2, weights=(1, 0))
+            assert ids.tolist() == [1, 4]
+
+            ids, scores = hybrid_search(session, Document.id, Document.embedding, Document.content, [1, 0, 0.1], 'growling bear', k=1, candidates=1, where=Document.id != 1)
+            assert ids.tolist() == [3, 4]
+            assert scores.tolist() == [0.5, 0.5]
+
+    def test_fused_search(self, engine):
+        create_documents()
+        with Session(engine) as session:
+            retrievers = [
+                vector_retriever(Document.id, Document.embedding, [1, 0, 0.1]),
+                vector_retriever(Document.id, Document.sparse_embedding, SparseVector([0.5, 1, 0]), distance='max_inner_product', candidates=2),
+                text_retriever(Document.id, Document.content, 'growling bear', where=Document.id != 4)
+            ]
+            ids, scores = fused_search(session, retrievers)
+            assert ids.tolist() == [4, 3, 2, 1]
+            assert np.allclose(scores, [1 / 62 + 1 / 61, 1 / 63 + 1 / 61, 1 / 64 + 1 / 62, 1 / 61])
+
+            ids, _ = fused_search(session, retrievers, weights=(1, 0, 0), limit=2)
+            assert ids.tolist() == [1, 4]
+
+            ids, scores = fused_search(session, retrievers[:1], method='score')
+            assert ids.tolist() == [1, 4, 3, 2]
+            assert scores[0] == 1
+            assert scores[-1] == 0
+
+            with pytest.raises(ValueError, match='expected 3 weights, not 2'):
+                fusion_query(retrievers, weights=(1, 1))
+
+    def test_knn(self, engine):
+        create_items()
+        with Session(engine) as session:
+            items = session.scalars(knn(Item.embedding, [1, 1, 1], k=2, ef_search=100, iterative_scan='relaxed_order')).all()
+            assert [v.id for v in items] == [1, 3]
+            assert session.execute(text('SHOW hnsw.ef_search')).scalar() == '100'
+            assert session.execute(text('SHOW hnsw.iterative_scan')).scalar() == 'relaxed_order'
+            assert session.execute(text('SHOW ivfflat.iterative_scan')).scalar() == 'relaxed_order'
+            session.commit()
+            assert session.execute(text('SHOW hnsw.ef_search')).scalar() == '40'
+
+    def test_knn_core(self, engine):
+        create_items()
+        table = Item.__table__
+        with engine.begin() as conn:
+            rows = conn.execute(knn(table.c.embedding, [1, 1, 1], k=3, distance='l1_distance', probes=2).where(table.c.id != 1)).all()
+            assert [row.id for row in rows] == [3, 2]
+            assert conn.execute(text('SHOW ivfflat.probes')).scalar() == '2'
+
+    def test_knn_autocommit(self, engine):
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            with pytest.raises(ValueError, match='index settings require a transaction, not autocommit'):
+                conn.execute(knn(Item.embedding, [1, 1, 1], ef_search=100))
+
+            # no settings
+            conn.execute(knn(Item.embedding, [1, 1, 1]))
+
+    def test_knn_cache(self, engine):
+        stmt = knn(Item.embedding, [1, 1, 1], ef_search=10)
+        other = knn(Item.embedding, [2, 2, 2], ef_search=20)
+        assert stmt._generate_cache_key().key == other._generate_cache_key().key
+        assert str(stmt) == str(other)
+        assert knn(Item.embedding, [1, 1, 1], iterative_scan='strict_order').get_execution_options()['pgvector_settings'] == (('hnsw.iterative_scan', 'strict_order'),)
+
+    def test_cached_neighbors(self, engine):
+        create_items()
+        cache = NeighborCache()
+        with Session(engine) as session:
+            invalidate_on_commit(session, cache)
+
+            for _ in range(2):
+                ids, distances = cached_neighbors(session, cache, Item.id, Item.embedding, [1, 1, 1], k=2, distance='l1_distance', where=Item.id != 3)
+                assert ids.tolist() == [1, 2]
+                assert distances.tolist() == [0, 3]
+            assert cache.info()['hits'] == 1
+
+            # different filter
+            ids, _ = cached_neighbors(session, cache, Item.id, Item.embedding, [1, 1, 1], k=2, distance='l1_distance', where=Item.id != 2)
+            assert ids.tolist() == [1, 3]
+            assert len(cache) == 2
+
+            session.delete(session.get(Item, 1))
+            session.flush()
+            assert len(cache) == 2
+            session.commit()
+            assert len(cache) == 0
+
+            ids, _ = cached_neighbors(session, cache, Item.id, Item.embedding, [1, 1, 1], k=2, distance='l1_distance', where=Item.id != 3)
+            assert ids.tolist() == [2]
+
+    def test_invalidate_on_rollback(self, engine):
+        create_items()
+        cache = NeighborCache()
+        with Session(engine) as session:
+            invalidate_on_commit(session, cache)
+
+            session.delete(session.get(Item, 1))
+            session.flush()
+            ids, _ = cached_neighbors(session, cache, Item.id, Item.embedding, [1, 1, 1], k=2, distance='l1_distance')
+            assert ids.tolist() == [3, 2]
+            session.rollback()
+            assert len(cache) == 0
+
+            ids, _ = cached_neighbors(session, cache, Item.id, Item.embedding, [1, 1, 1], k=2, distance='l1_distance')
+            assert ids.tolist() == [1, 3]
+
     def test_binary_quantize_reranking(self, engine):
         # recreate index (could also vacuum table)
         binary_quantize_index.drop(setup_engine)
@@ -568,6 +813,84 @@ class TestSqlalchemyArray:
             assert item.half_embeddings == [HalfVector([1, 2, 3]), HalfVector([4, 5, 6])]
 
 
+@pytest.mark.parametrize('engine', engines)
+class TestSqlalchemyIndex:
+    def setup_method(self):
+        self.metadata = MetaData()
+        self.table = Table(
+            'sqlalchemy_index_item',
+            self.metadata,
+            Column('id', Integer, primary_key=True),
+            Column('embedding', VECTOR(3))
+        )
+        self.metadata.drop_all(setup_engine)
+
+    def teardown_method(self):
+        self.metadata.drop_all(setup_engine)
+
+    def index_def(self, conn):
+        return conn.execute(text("SELECT indexdef FROM pg_indexes WHERE indexname = 'sqlalchemy_index'")).scalar()
+
+    def test_hnsw(self, engine):
+        index = HnswIndex('sqlalchemy_index', self.table.c.embedding, 'vector_cosine_ops', m=8, ef_construction=32)
+        with engine.begin() as conn:
+            self.metadata.create_all(conn)
+            assert 'USING hnsw (embedding vector_cosine_ops) WITH (m=\'8\', ef_construction=\'32\')' in self.index_def(conn)
+            assert index.progress(conn) is None
+
+    def test_ivfflat(self, engine):
+        IvfflatIndex('sqlalchemy_index', self.table.c.embedding, lists=1)
+        with engine.begin() as conn:
+            self.metadata.create_all(conn)
+            assert 'USING ivfflat (embedding) WITH (lists=\'1\')' in self.index_def(conn)
+
+    def test_expression(self, engine):
+        IvfflatIndex('sqlalchemy_index', func.cast(self.table.c.embedding, HALFVEC(3)).label('embedding'), 'halfvec_l2_ops', lists=1)
+        with engine.begin() as conn:
+            self.metadata.create_all(conn)
+            assert 'USING ivfflat (((embedding)::halfvec(3)) halfvec_l2_ops)' in self.index_def(conn)
+
+    def test_build_settings(self, engine):
+        index = HnswIndex('sqlalchemy_index', self.table.c.embedding, maintenance_work_mem='128MB', max_parallel_maintenance_workers=1)
+        settings = []
+
+        @event.listens_for(index, 'before_create')
+        def before_create(target, conn, **kw):
+            settings.append(conn.execute(text('SHOW maintenance_work_mem')).scalar())
+            settings.append(conn.execute(text('SHOW max_parallel_maintenance_workers')).scalar())
+
+        with engine.begin() as conn:
+            conn.execute(text("SET maintenance_work_mem = '32MB'"))
+            self.metadata.create_all(conn)
+            assert settings == ['128MB', '1']
+            assert conn.execute(text('SHOW maintenance_work_mem')).scalar() == '32MB'
+            conn.execute(text('RESET maintenance_work_mem'))
+
+    def test_concurrently(self, engine):
+        self.metadata.create_all(setup_engine)
+        index = HnswIndex('sqlalchemy_index', self.table.c.embedding, concurrently=True, maintenance_work_mem='256MB')
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            index.create(conn)
+            assert 'USING hnsw' in self.index_def(conn)
+            assert conn.execute(text('SHOW maintenance_work_mem')).scalar() != '256MB'
+
+    def test_failed_build(self, engine):
+        self.metadata.create_all(setup_engine)
+        index = HnswIndex('sqlalchemy_index', self.table.c.embedding, 'missing_ops', concurrently=True, maintenance_work_mem='256MB')
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            with pytest.raises(Exception, match='missing_ops'):
+                index.create(conn)
+            assert conn.execute(text('SHOW maintenance_work_mem')).scalar() != '256MB'
+            assert conn.info.get(('pgvector_build_settings', 'sqlalchemy_index')) is None
+
+        index = HnswIndex('sqlalchemy_index', self.table.c.embedding, 'missing_ops', maintenance_work_mem='256MB')
+        with engine.connect() as conn:
+            with pytest.raises(Exception, match='missing_ops'):
+                index.create(conn)
+            conn.rollback()
+            assert conn.execute(text('SHOW maintenance_work_mem')).scalar() != '256MB'
+
+
 @pytest.mark.parametrize('engine', async_engines)
 class TestSqlalchemyAsync:
     def setup_method(self):
@@ -605,18 +928,27 @@ class TestSqlalchemyAsync:
 
         async with async_session() as session:
             async with session.begin():
-                embedding = asyncpg.BitString('101') if engine == asyncpg_engine else '101'
+                embedding = asyncpg.BitString('101') if engine in [asyncpg_engine, asyncpg_binary_engine] else '101'
                 session.add(Item(id=1, binary_embedding=embedding))
                 item = await session.get(Item, 1)
                 assert item.binary_embedding == embedding
 
-                if engine == asyncpg_engine:
+                if engine in [asyncpg_engine, asyncpg_binary_engine]:
                     session.add(Item(id=2, binary_embedding='101'))
                     item = await session.get(Item, 2)
                     assert item.binary_embedding == embedding
 
         await engine.dispose()
 
+    @pytest.mark.asyncio
+    async def test_bit_object(self, engine):
+        async with engine.begin() as conn:
+            await conn.execute(insert(bit_table), [{'id': 1, 'binary_embedding': Bit('101')}, {'id': 2, 'binary_embedding': '110'}])
+            assert (await conn.execute(select(bit_table.c.binary_embedding).order_by(bit_table.c.id))).scalars().all() == [Bit('101'), Bit('110')]
+            assert (await conn.execute(select(packed_table.c.binary_embedding).order_by(packed_table.c.id))).scalars().all()[0].tolist() == [160]
+
+        await engine.dispose()
+
     @pytest.mark.asyncio
     async def test_sparsevec(self, engine):
         async_session = async_sessionmaker(engine, expire_on_commit=False)
@@ -630,6 +962,69 @@ class TestSqlalchemyAsync:
 
         await engine.dispose()
 
+    @pytest.mark.asyncio
+    async def test_batch_neighbors(self, engine):
+        create_items()
+        async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with async_session() as session:
+            ids, distances = await session.run_sync(batch_neighbors, Item.id, Item.embedding, np.array([[1, 1, 1], [2, 2, 2]]), k=2, distance='l1_distance')
+            assert ids.tolist() == [[1, 3], [2, 3]]
+
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert(self, engine):
+        async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with async_session() as session:
+            async with session.begin():
+                rows = [{'id': i, 'embedding': np.array([i, i, i]), 'half_embedding': [i, i, i], 'sparse_embedding': SparseVector([i, 0, i])} for i in range(1, 4)]
+                assert await bulk_insert_async(session, Item, rows, min_copy_rows=1) == 3
+                items = (await session.scalars(select(Item).order_by(Item.id))).all()
+                assert [item.id for item in items] == [1, 2, 3]
+                assert np.array_equal(items[2].embedding, [3, 3, 3])
+                assert items[2].half_embedding == HalfVector([3, 3, 3])
+                assert items[2].sparse_embedding == SparseVector([3, 0, 3])
+
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_column_matrix(self, engine):
+        create_items()
+        async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with async_session() as session:
+            result = await session.stream(select(Item.embedding).order_by(Item.id).execution_options(yield_per=2))
+            matrix = await column_matrix_async(result)
+            assert matrix.tolist() == [[1, 1, 1], [2, 2, 2], [1, 1, 2]]
+
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search(self, engine):
+        create_documents()
+        async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with async_session() as session:
+            ids, _ = await session.run_sync(hybrid_search, Document.id, Document.embedding, Document.content, [1, 0, 0.1], 'growling bear')
+            assert ids.tolist() == [3, 1, 4, 2]
+
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_knn(self, engine):
+        create_items()
+        async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with async_session() as session:
+            async with session.begin():
+                items = (await session.scalars(knn(Item.embedding, [1, 1, 1], k=2, ef_search=100))).all()
+                assert [v.id for v in items] == [1, 3]
+                assert (await session.execute(text('SHOW hnsw.ef_search'))).scalar() == '100'
+
+        await engine.dispose()
+
     @pytest.mark.asyncio
     async def test_avg(self, engine):
         async_session = async_sessionmaker(engine, expire_on_commit=False)